@@ -147,7 +147,8 @@ def commit_entries(payload: dict[str, Any]) -> list[dict[str, Any]]:
 
 def commit_message(commit: dict[str, Any]) -> str:
     message = str(commit.get("message") or "").strip()
-    return message.splitlines()[0] if message else ""
+    # Only the subject line is needed; do not split the whole body.
+    return message.partition("\n")[0].rstrip("\r")
 
 
 def _payload_bool(value: Any, key: str) -> bool:
@@ -5,7 +5,6 @@ import asyncio
 import json
 import logging
 import os
-import shlex
 import threading
 import time
 from collections.abc import AsyncIterator, Awaitable, Callable
@@ -168,6 +167,7 @@ from guildbotics.utils.fileio import (
 )
 from guildbotics.utils.i18n_tool import t
 from guildbotics.utils.secret_store import read_env_values, write_env_values
+from guildbotics.utils.text_utils import split_command_line
 from guildbotics.utils.workspace_state import (
     GUILDBOTICS_CONFIG_DIR,
     write_active_workspace,
@@ -1942,7 +1942,7 @@ def _referenced_command_requirement_kinds(
 
 def _command_reference_name(command_text: str) -> str:
     try:
-        parts = shlex.split(command_text)
+        parts = split_command_line(command_text)
     except ValueError:
         return ""
     return parts[0] if parts else ""
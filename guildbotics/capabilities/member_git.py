@@ -365,7 +365,7 @@ def _commit_summary(commit: git.Commit, url: str) -> dict[str, str]:
     message = str(commit.message or "").strip()
     return {
         "id": commit.hexsha,
-        "message": message.splitlines()[0] if message else commit.hexsha[:7],
+        "message": message.partition("\n")[0].rstrip("\r") or commit.hexsha[:7],
         "url": url,
     }
 
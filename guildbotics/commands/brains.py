@@ -7,4 +7,10 @@ _DISABLED_BRAINS = frozenset({"none", "-", "null", "disabled"})
 
 def is_brain_disabled(value: object) -> bool:
     """Return whether a command explicitly disables brain execution."""
+    if isinstance(value, str):
+        # Fast paths for an omitted brain and already-normalized sentinels.
+        if not value:
+            return False
+        if value in _DISABLED_BRAINS:
+            return True
     return str(value).strip().lower() in _DISABLED_BRAINS
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import re
 import shlex
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -13,12 +14,17 @@ from guildbotics.commands.models import CommandOutcome, CommandSpec, InvocationO
 from guildbotics.runtime.context import Context
 from guildbotics.utils.import_utils import ClassResolver
 
+# "$name" or "${ name }"; the braced form is stripped, the bare one is not.
+_PLACEHOLDER_RE = re.compile(r"\$(?:\{(?P<braced>.*)\}|(?P<bare>.*))", re.DOTALL)
+
 
 class CommandBase(ABC):
     """Base interface for custom command executors."""
 
     extensions: ClassVar[list[str]]
     inline_key: ClassVar[str]
+    # Commands that only declare children are never instantiated or run.
+    definition_only: ClassVar[bool] = False
 
     def __init__(self, context: Context, spec: CommandSpec, cwd: Path) -> None:
         self._context = context
@@ -64,11 +70,6 @@ class CommandBase(ABC):
     def is_inline_only(cls) -> bool:
         return len(cls.extensions) == 0
 
-    @classmethod
-    def is_inline_command(cls, data: dict[str, Any]) -> bool:
-        """Determine if the given data represents an inline command of this type."""
-        return cls.get_inline_key() in data
-
     @abstractmethod
     async def run(self) -> CommandOutcome | None:
         """Execute the command and return its outcome."""
@@ -79,15 +80,29 @@ class CommandBase(ABC):
         else:
             message = self._context.pipe
 
-        params = spec.params.copy()
-        for key, value in params.items():
-            if isinstance(value, str):
-                params[key] = self._replace_placeholders(value)
-
-        args = list(spec.args) if spec.args else []
-        for index, arg in enumerate(args):
-            if isinstance(arg, str):
-                args[index] = str(self._replace_placeholders(arg))
+        # Only "$"-prefixed strings are placeholders; test that inline so
+        # plain values skip the resolver call entirely, and skip the
+        # comprehensions outright for the common command without any.
+        params = (
+            {
+                key: self._replace_placeholders(value)
+                if isinstance(value, str) and value.startswith("$")
+                else value
+                for key, value in spec.params.items()
+            }
+            if spec.params
+            else {}
+        )
+        args = (
+            [
+                str(self._replace_placeholders(arg))
+                if isinstance(arg, str) and arg.startswith("$")
+                else arg
+                for arg in spec.args
+            ]
+            if spec.args
+            else []
+        )
 
         return InvocationOptions(
             args=args,
@@ -97,12 +112,11 @@ class CommandBase(ABC):
         )
 
     def _replace_placeholders(self, text: str) -> Any:
-        if not text.startswith("$"):
+        match = _PLACEHOLDER_RE.fullmatch(text)
+        if match is None:
             return text
-
-        text = text[1:]  # Remove leading $
-        if text.startswith("{") and text.endswith("}"):
-            text = text[1:-1].strip()
+        braced = match["braced"]
+        text = braced.strip() if braced is not None else match["bare"]
 
         if "." in text:
             parts = text.split(".")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Iterable, Iterator
 from pathlib import Path
 
@@ -74,12 +75,38 @@ def resolve_command_path(
     Returns:
         The resolved on-disk path, or ``None`` when the command is not found.
     """
-    for path in iter_candidate_paths(identifier, language_code, person_id):
-        if path.exists() and is_command_source_path(path):
+    candidates = iter_candidate_paths(identifier, language_code, person_id)
+    for path in _iter_existing_paths(candidates):
+        if is_command_source_path(path):
             return path
     return None
 
 
+def _iter_existing_paths(paths: Iterable[Path]) -> Iterator[Path]:
+    """Yield the given paths that exist, listing each parent directory once.
+
+    Most candidates are absent, so one directory listing replaces a stat call
+    per candidate. Names are matched case-insensitively and then confirmed with
+    ``exists()``, which keeps case-insensitive filesystems and broken symlinks
+    behaving exactly like a plain ``exists()`` probe.
+    """
+    listings: dict[Path, frozenset[str]] = {}
+    for path in paths:
+        names = listings.get(path.parent)
+        if names is None:
+            names = listings[path.parent] = _list_casefolded_names(path.parent)
+        if path.name.casefold() in names and path.exists():
+            yield path
+
+
+def _list_casefolded_names(directory: Path) -> frozenset[str]:
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name.casefold() for entry in entries)
+    except OSError:
+        return frozenset()
+
+
 def resolve_prospective_shared_command(
     target: Path, identifier: str, language_code: str
 ) -> Path | None:
@@ -208,10 +235,10 @@ def resolve_command_reference(base_dir: Path, value: str, context: Context) -> P
         if anchored.exists():
             return anchored
     else:
-        for extension in get_command_extensions():
-            extended = anchored.with_suffix(extension)
-            if extended.exists():
-                return extended
+        extended = (anchored.with_suffix(ext) for ext in get_command_extensions())
+        found = next(_iter_existing_paths(extended), None)
+        if found is not None:
+            return found
 
     if anchored.exists():
         return anchored
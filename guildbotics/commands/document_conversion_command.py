@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, ClassVar
-
-from markdown_it import MarkdownIt
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from guildbotics.commands.command_base import CommandBase
 from guildbotics.commands.errors import CommandError
 
+if TYPE_CHECKING:
+    from markdown_it import MarkdownIt
+
+
+@lru_cache(maxsize=1)
+def _markdown_renderer() -> MarkdownIt:
+    # Imported on first render so loading the command registry stays cheap.
+    from markdown_it import MarkdownIt
+
+    return MarkdownIt()
+
 
 class DocumentConversionCommand(CommandBase):
     """Base class providing shared helpers for inline document conversion commands."""
@@ -15,8 +25,6 @@ class DocumentConversionCommand(CommandBase):
     _DEFAULT_CSS_PATH: ClassVar[Path]
     inline_key: ClassVar[str]
 
-    _MARKDOWN_RENDERER = MarkdownIt()
-
     def _extract_inline_config(self) -> dict[str, Any]:
         config: dict[str, Any] = {}
         value = self.spec.get_config_value(self.inline_key)
@@ -64,7 +72,7 @@ class DocumentConversionCommand(CommandBase):
             raise CommandError(f"Unable to read CSS file '{css_path}': {exc}") from exc
 
     def _render_markdown(self, markdown_source: str) -> str:
-        return self._MARKDOWN_RENDERER.render(markdown_source)
+        return _markdown_renderer().render(markdown_source)
 
     def _compose_document(self, body_html: str, css_text: str) -> str:
         head_parts = ['<meta charset="utf-8">']
@@ -33,22 +33,19 @@ class MarkdownCommand(CommandBase):
 
     async def run(self) -> CommandOutcome | None:
         config, inline = self._load_markdown_metadata()
-        if not config.get("body"):
+        body = config.get("body")
+        if not body:
             return None
 
-        params = {**self.context.shared_state, **self.options.params}
         if is_brain_disabled(config.get("brain", "")):
-            template_engine = config.get("template_engine", "default")
-            params = self._inject_session_state(params)
-            result = replace_placeholders(config["body"], params, template_engine)
-            return CommandOutcome(result=result, text_output=result)
+            return self._render(body, config.get("template_engine", "default"))
 
         try:
             output = await get_content(
                 self.context,
                 str(self.spec.path),
                 self.options.message,
-                params,
+                self._build_params(),
                 self.cwd,
                 config if inline else None,
                 self.spec.class_resolver,
@@ -61,17 +58,23 @@ class MarkdownCommand(CommandBase):
         text_output = stringify_output(output)
         return CommandOutcome(result=output, text_output=text_output)
 
-    def _inject_session_state(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _build_params(self) -> dict[str, Any]:
+        params = dict(self.context.shared_state)
+        params.update(self.options.params)
+        return params
+
+    def _render(self, body: str, template_engine: str) -> CommandOutcome:
+        """Render the body locally with session state instead of calling a brain."""
+        params = self._build_params()
         session_data = to_dict(self.context, {})
-        session_state = session_data.get("session_state", {})
-        return {**params, **session_state}
+        params.update(session_data.get("session_state", {}))
+        result = replace_placeholders(body, params, template_engine)
+        return CommandOutcome(result=result, text_output=result)
 
     def _load_markdown_metadata(self) -> tuple[dict[str, Any], bool]:
         prompt = self.spec.get_config_value(self.inline_key)
         if prompt is not None:
-            config = self.spec.config.copy()
-            config["body"] = str(prompt)
-            return config, True
+            return {**self.spec.config, "body": str(prompt)}, True
 
         if self.spec.path is None:
             raise CommandError(
@@ -10,19 +10,21 @@ if TYPE_CHECKING:
     from guildbotics.commands.command_base import CommandBase
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandSpec:
     """Normalized representation of a command or error handler definition."""
 
     name: str
     base_dir: Path
     command_class: type[CommandBase]
+    cwd: Path
     path: Path | None = None
     params: dict[str, Any] = field(default_factory=dict)
     args: list[Any] | None = None
     stdin_override: str | None = None
     children: list[CommandSpec] = field(default_factory=list)
-    cwd: Path = field(default_factory=Path.cwd)
+    # Run children concurrently (``parallel: true`` in the command file).
+    parallel_children: bool = False
     command_index: int = 0
     config: dict[str, Any] = field(default_factory=dict)
     class_resolver: ClassResolver | None = None
@@ -33,13 +35,13 @@ class CommandSpec:
         return default
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandOutcome:
     result: Any
     text_output: str
 
 
-@dataclass
+@dataclass(slots=True)
 class InvocationOptions:
     args: list[Any]
     message: str
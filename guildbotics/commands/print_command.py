@@ -10,15 +10,17 @@ class PrintCommand(MarkdownCommand):
     """
     A Markdown command that prints output using the 'print' inline key.
 
-    This command is inline-only and sets the template engine to 'jinja2' and disables the 'brain' feature.
-    It differs from the base MarkdownCommand by customizing the config for template rendering and disabling
-    any AI/brain processing.
+    This command is inline-only and always renders its body with the 'jinja2' template engine.
+    It differs from the base MarkdownCommand by never invoking a brain, so the brain selection
+    and template engine in the config are not consulted.
     """
 
     extensions: ClassVar[list[str]] = []
     inline_key: ClassVar[str] = "print"
 
     async def run(self) -> CommandOutcome | None:
-        self.spec.config["template_engine"] = "jinja2"
-        self.spec.config["brain"] = "none"
-        return await super().run()
+        config, _ = self._load_markdown_metadata()
+        body = config.get("body")
+        if not body:
+            return None
+        return self._render(body, "jinja2")
@@ -3,7 +3,10 @@ from __future__ import annotations
 import importlib.util
 import inspect
 import sys
+from collections.abc import Callable, Hashable
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any, ClassVar
 
 from guildbotics.commands.command_base import CommandBase
@@ -11,6 +14,10 @@ from guildbotics.commands.errors import CommandError
 from guildbotics.commands.models import CommandOutcome
 from guildbotics.commands.utils import stringify_output
 
+_KEYWORD_KINDS = frozenset(
+    {inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD}
+)
+
 
 class PythonCommand(CommandBase):
     extensions: ClassVar[list[str]] = [".py"]
@@ -28,8 +35,7 @@ class PythonCommand(CommandBase):
                 f"Python command '{self.spec.path}' must define a callable 'main'."
             )
 
-        sig = inspect.signature(entry)
-        params = list(sig.parameters.values())
+        params = list(_entry_parameters(entry))
 
         args = [
             arg
@@ -55,17 +61,18 @@ class PythonCommand(CommandBase):
                     index += 1
                 break
 
-        params = params[index:]
-        if params:
-            assigned_keywords = 0
-            for key in self.options.params:
-                if _is_keyword(params, key):
-                    call_kwargs[key] = kwargs.pop(key)
-                    assigned_keywords += 1
-
-            for idx in range(assigned_keywords, len(params)):
-                if params[idx].kind == inspect.Parameter.VAR_KEYWORD:
-                    call_kwargs.update(kwargs)
+        keyword_names: set[str] = set()
+        accepts_var_keyword = False
+        for param in params[index:]:
+            if param.kind in _KEYWORD_KINDS:
+                keyword_names.add(param.name)
+            elif param.kind is inspect.Parameter.VAR_KEYWORD:
+                accepts_var_keyword = True
+        for key in self.options.params:
+            if key in keyword_names:
+                call_kwargs[key] = kwargs.pop(key)
+        if accepts_var_keyword:
+            call_kwargs.update(kwargs)
 
         func_result = entry(*call_args, **call_kwargs)
         if inspect.iscoroutine(func_result):
@@ -75,7 +82,16 @@ class PythonCommand(CommandBase):
         return CommandOutcome(result=func_result, text_output=text_output)
 
 
-def _load_python_module(path: Path) -> Any:
+def _load_python_module(path: Path) -> ModuleType:
+    # Top-level code runs once per file version; edits are picked up by the
+    # mtime/size key, like markdown frontmatter in fileio.
+    stat = path.stat()
+    return _load_python_module_cached(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=128)
+def _load_python_module_cached(file: str, mtime_ns: int, size: int) -> ModuleType:
+    path = Path(file)
     spec = importlib.util.spec_from_file_location(path.stem, path)
     if spec is None or spec.loader is None:
         raise CommandError(f"Unable to load python command module from '{path}'.")
@@ -85,6 +101,22 @@ def _load_python_module(path: Path) -> Any:
     return module
 
 
+def _entry_parameters(entry: Callable[..., Any]) -> tuple[inspect.Parameter, ...]:
+    # Unhashable callables (e.g. eq=True dataclass instances) cannot key the
+    # cache, so their signature is inspected on every run.
+    if not isinstance(entry, Hashable):
+        return tuple(inspect.signature(entry).parameters.values())
+    return _entry_parameters_cached(entry)
+
+
+@lru_cache(maxsize=128)
+def _entry_parameters_cached(
+    entry: Callable[..., Any],
+) -> tuple[inspect.Parameter, ...]:
+    # Keyed by the function object, which lives as long as its cached module.
+    return tuple(inspect.signature(entry).parameters.values())
+
+
 def _is_positional(params: list[inspect.Parameter], index: int) -> bool:
     if index >= len(params):
         return False
@@ -94,16 +126,6 @@ def _is_positional(params: list[inspect.Parameter], index: int) -> bool:
     )
 
 
-def _is_keyword(params: list[inspect.Parameter], key: str) -> bool:
-    for param in params:
-        if param.name == key and param.kind in (
-            inspect.Parameter.KEYWORD_ONLY,
-            inspect.Parameter.POSITIONAL_OR_KEYWORD,
-        ):
-            return True
-    return False
-
-
 def _is_var_positional(params: list[inspect.Parameter], index: int) -> bool:
     if index >= len(params):
         return False
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from guildbotics.commands.command_base import CommandBase
@@ -8,6 +10,7 @@ if TYPE_CHECKING:
 # Lazy caches populated on first access
 _COMMAND_TYPES: tuple[type[CommandBase], ...] | None = None
 _COMMAND_REGISTRY: dict[str, type[CommandBase]] | None = None
+_INLINE_COMMANDS: dict[str, type[CommandBase]] | None = None
 
 
 def _ensure_registry() -> None:
@@ -16,8 +19,12 @@ def _ensure_registry() -> None:
     This avoids import-time circular dependencies by importing concrete
     command classes only when needed.
     """
-    global _COMMAND_TYPES, _COMMAND_REGISTRY
-    if _COMMAND_TYPES is not None and _COMMAND_REGISTRY is not None:
+    global _COMMAND_TYPES, _COMMAND_REGISTRY, _INLINE_COMMANDS
+    if (
+        _COMMAND_TYPES is not None
+        and _COMMAND_REGISTRY is not None
+        and _INLINE_COMMANDS is not None
+    ):
         return
 
     # Import concrete command classes lazily to avoid circular imports
@@ -44,6 +51,11 @@ def _ensure_registry() -> None:
         for ext in command_type.get_extensions()
         if not command_type.is_inline_only()
     }
+    _INLINE_COMMANDS = {
+        command_type.get_inline_key(): command_type
+        for command_type in _COMMAND_TYPES
+        if command_type.get_inline_key()
+    }
 
 
 def get_command_types() -> tuple[type[CommandBase], ...]:
@@ -54,22 +66,41 @@ def get_command_types() -> tuple[type[CommandBase], ...]:
     return _COMMAND_TYPES
 
 
+@lru_cache(maxsize=1)
 def get_command_extensions() -> tuple[str, ...]:
-    """Return the registered command extensions."""
+    """Return the registered command extensions.
+
+    Discovery checks every candidate file's suffix against this tuple, so it
+    is built once rather than on each call.
+    """
     _ensure_registry()
     assert _COMMAND_REGISTRY is not None
     return tuple(_COMMAND_REGISTRY.keys())
 
 
+def find_inline_command_class(data: Mapping[str, Any]) -> type[CommandBase] | None:
+    """Return the first registered command type whose inline key is in ``data``."""
+    _ensure_registry()
+    assert _INLINE_COMMANDS is not None
+    for inline_key, command_type in _INLINE_COMMANDS.items():
+        if inline_key in data:
+            return command_type
+    return None
+
+
+@lru_cache(maxsize=64)
 def find_command_class(extension: str) -> type[CommandBase]:
-    """Return the registered command class for the given file extension."""
+    """Return the registered command class for the given file extension.
+
+    The registry is immutable once populated, so resolved classes are memoized
+    per raw extension; unknown extensions raise and are never cached.
+    """
     from guildbotics.commands.errors import CommandError
 
     _ensure_registry()
-    extension = extension.lower()
-    registry = _COMMAND_REGISTRY
-    assert registry is not None
-    if extension not in registry:
-        raise CommandError(f"Unknown command type: '{extension}'.")
+    assert _COMMAND_REGISTRY is not None
+    command_class = _COMMAND_REGISTRY.get(extension.lower())
+    if command_class is None:
+        raise CommandError(f"Unknown command type: '{extension.lower()}'.")
 
-    return registry[extension]
+    return command_class
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import os
 import tempfile
-from contextlib import suppress
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from pathlib import Path
 from typing import ClassVar
 
@@ -18,22 +22,23 @@ class ShellScriptCommand(CommandBase):
     inline_key: ClassVar[str] = "script"
 
     async def run(self) -> CommandOutcome:
-        env = os.environ.copy()
-        for key, value in self.options.params.items():
-            env[key] = stringify_output(value)
+        # Without params the child simply inherits the environment (env=None).
+        params = self.options.params
+        env = (
+            {**os.environ, **{key: stringify_output(v) for key, v in params.items()}}
+            if params
+            else None
+        )
 
-        executable_path = self.spec.path
-        temp_file_name: str | None = None
         script = self.spec.get_config_value("script")
-        if script is not None:
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".sh", delete=False
-            ) as tmp_file:
-                tmp_file.write(script)
-                tmp_file.flush()
-                temp_file_name = tmp_file.name
-            executable_path = Path(temp_file_name)
+        if script is None:
+            return await self._run_script(self.spec.path, env)
+        with _inline_script_path(script) as executable_path:
+            return await self._run_script(executable_path, env)
 
+    async def _run_script(
+        self, executable_path: Path | None, env: dict[str, str] | None
+    ) -> CommandOutcome:
         if executable_path is None:
             raise CommandError(
                 f"Shell command '{self.spec.name}' is missing a script or executable path."
@@ -46,17 +51,20 @@ class ShellScriptCommand(CommandBase):
         )
         args.extend(str(item) for item in self.options.args)
 
+        # An empty message needs no stdin pipe; the script just reads EOF.
+        stdin_data = self.options.message.encode("utf-8") or None
         try:
             process = await asyncio.create_subprocess_exec(
                 *args,
-                stdin=asyncio.subprocess.PIPE,
+                stdin=asyncio.subprocess.PIPE
+                if stdin_data
+                else asyncio.subprocess.DEVNULL,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=self.spec.cwd,
                 env=env,
             )
 
-            stdin_data = self.options.message.encode("utf-8")
             stdout_data, stderr_data = await process.communicate(stdin_data)
 
             if process.returncode != 0:
@@ -73,7 +81,53 @@ class ShellScriptCommand(CommandBase):
             raise CommandError(
                 f"Shell command '{executable_path}' could not be executed."
             ) from exc
-        finally:
-            if temp_file_name is not None:
-                with suppress(OSError):
-                    os.remove(temp_file_name)
+
+
+# Inline scripts are written once per distinct body and reused by later runs.
+# Scheduler worker threads share the cache, so it is guarded by a lock and keeps
+# only the most recently used bodies. An evicted file is removed as soon as no
+# run is still executing it; the rest are removed when the process exits.
+_MAX_INLINE_SCRIPTS = 64
+_INLINE_SCRIPT_PATHS: OrderedDict[str, Path] = OrderedDict()
+_INLINE_SCRIPT_USERS: Counter[Path] = Counter()
+_INLINE_SCRIPT_LOCK = threading.Lock()
+
+
+@contextmanager
+def _inline_script_path(script: str) -> Iterator[Path]:
+    with _INLINE_SCRIPT_LOCK:
+        path = _INLINE_SCRIPT_PATHS.get(script)
+        if path is None or not path.is_file():
+            with tempfile.NamedTemporaryFile(
+                mode="w", suffix=".sh", delete=False
+            ) as tmp_file:
+                tmp_file.write(script)
+            path = _INLINE_SCRIPT_PATHS[script] = Path(tmp_file.name)
+        _INLINE_SCRIPT_PATHS.move_to_end(script)
+        _INLINE_SCRIPT_USERS[path] += 1
+        while len(_INLINE_SCRIPT_PATHS) > _MAX_INLINE_SCRIPTS:
+            _, evicted = _INLINE_SCRIPT_PATHS.popitem(last=False)
+            if not _INLINE_SCRIPT_USERS[evicted]:
+                _unlink_quietly(evicted)
+    try:
+        yield path
+    finally:
+        with _INLINE_SCRIPT_LOCK:
+            _INLINE_SCRIPT_USERS[path] -= 1
+            if not _INLINE_SCRIPT_USERS[path]:
+                del _INLINE_SCRIPT_USERS[path]
+                if _INLINE_SCRIPT_PATHS.get(script) != path:
+                    _unlink_quietly(path)
+
+
+def _unlink_quietly(path: Path) -> None:
+    with suppress(OSError):
+        path.unlink()
+
+
+@atexit.register
+def _remove_inline_scripts() -> None:
+    with _INLINE_SCRIPT_LOCK:
+        for path in _INLINE_SCRIPT_PATHS.values():
+            _unlink_quietly(path)
+        _INLINE_SCRIPT_PATHS.clear()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import shlex
 from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -12,15 +12,26 @@ from guildbotics.commands.arguments import (
 from guildbotics.commands.discovery import resolve_command_reference
 from guildbotics.commands.errors import CommandError
 from guildbotics.commands.models import CommandSpec
-from guildbotics.commands.registry import find_command_class, get_command_types
+from guildbotics.commands.registry import (
+    find_command_class,
+    find_inline_command_class,
+)
 from guildbotics.utils.import_utils import ClassResolver
-from guildbotics.utils.text_utils import get_placeholders_from_args
+from guildbotics.utils.text_utils import (
+    get_placeholders_from_args,
+    split_command_line,
+)
 
 if TYPE_CHECKING:
-    from guildbotics.commands.command_base import CommandBase
     from guildbotics.runtime.context import Context
 
 
+@lru_cache(maxsize=1024)
+def _placeholders_from_args(args: tuple[str, ...], add_index: bool) -> dict[str, str]:
+    """Memoize placeholder extraction; callers must copy the shared result."""
+    return get_placeholders_from_args(list(args), add_index)
+
+
 class CommandSpecFactory:
     """Build `CommandSpec` instances from declarative command entries."""
 
@@ -53,7 +64,7 @@ class CommandSpecFactory:
 
         name = self._resolve_name(config, anchor)
         path = None
-        inline_command = self._is_inline_command(config, anchor)
+        inline_command = find_inline_command_class(config)
         if inline_command:
             kind = ""
             command_class = inline_command
@@ -96,7 +107,7 @@ class CommandSpecFactory:
         raise CommandError("Command entry must be a mapping or string.")
 
     def _parse_command(self, entry: str) -> dict[str, Any]:
-        words = shlex.split(entry)
+        words = split_command_line(entry)
         if not words:
             raise CommandError("Command entry string cannot be empty.")
         return {"path": words[0], "args": words[1:]}
@@ -124,15 +135,6 @@ class CommandSpecFactory:
         )
         return resolved, resolved.suffix.lower()
 
-    def _is_inline_command(
-        self, data: dict[str, Any], anchor: CommandSpec
-    ) -> type[CommandBase] | None:
-        for command_cls in get_command_types():
-            inline_command = command_cls.is_inline_command(data)
-            if inline_command:
-                return command_cls
-        return None
-
     def _normalize_args(self, raw_args: Any) -> list[Any]:
         if raw_args is None:
             return []
@@ -156,14 +158,15 @@ class CommandSpecFactory:
             else:
                 raise CommandError("Command params must be provided as a mapping.")
 
-        arg_params = self._get_placeholders_from_args(args, kind)
-        params.update(arg_params)
+        if args:
+            params.update(self._get_placeholders_from_args(args, kind))
 
         return params
 
     def _get_placeholders_from_args(self, args: list[Any], kind: str) -> dict[str, str]:
-        normalized_args = [str(arg) for arg in args]
-        return get_placeholders_from_args(normalized_args, kind != ".py")
+        # str() returns str args unchanged, so only mixed YAML values are copied.
+        cached = _placeholders_from_args(tuple(map(str, args)), kind != ".py")
+        return dict(cached)
 
     def _resolve_cwd(self, raw_cwd: Any, default: Path) -> Path:
         if raw_cwd is None:
@@ -190,6 +193,7 @@ class CommandSpecFactory:
         spec.params = resolve_command_argument_params(spec.params, definitions)
         spec.class_resolver = ClassResolver(config.get("schema", ""), class_resolver)
         spec.children = []
+        spec.parallel_children = config.get("parallel") is True
 
         raw_commands = config.get("commands")
         if raw_commands is None:
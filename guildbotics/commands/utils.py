@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import singledispatch
 from typing import Any
 
 from pydantic import BaseModel
@@ -7,17 +8,31 @@ from pydantic import BaseModel
 from guildbotics.intelligences.functions import to_text
 
 
+# Dispatch is cached per concrete type, so BaseModel subclasses resolve with
+# one dict lookup after their first call.
+@singledispatch
 def stringify_output(output: Any) -> str:
-    if output is None:
-        return ""
-    if isinstance(output, str):
-        return output
-    if isinstance(output, BaseModel):
-        return to_text(output)
-    if isinstance(output, dict):
-        return to_text(output)
-    if isinstance(output, list):
-        if output and isinstance(output[0], (BaseModel, dict)):
-            return to_text(output)
-        return "\n".join(str(item) for item in output)
     return str(output)
+
+
+@stringify_output.register(type(None))
+def _stringify_none(output: None) -> str:
+    return ""
+
+
+@stringify_output.register(str)
+def _stringify_str(output: str) -> str:
+    return output
+
+
+@stringify_output.register(BaseModel)
+@stringify_output.register(dict)
+def _stringify_structured(output: BaseModel | dict) -> str:
+    return to_text(output)
+
+
+@stringify_output.register(list)
+def _stringify_list(output: list) -> str:
+    if output and isinstance(output[0], (BaseModel, dict)):
+        return to_text(output)
+    return "\n".join(str(item) for item in output)
@@ -25,7 +25,7 @@ from guildbotics.commands.metadata import (
     parse_command_input_policy,
     parse_python_metadata_from_module,
 )
-from guildbotics.commands.registry import get_command_types
+from guildbotics.commands.registry import find_inline_command_class
 
 SHELL_VALIDATION_TIMEOUT_SECONDS = 5
 
@@ -286,10 +286,7 @@ def _validate_command_entry(entry: Any) -> None:
         # Mirror the spec factory's acceptance so a source that saves cannot
         # break at runtime: the entry must be an inline command (a registered
         # inline key) or reference another command via command/path/name.
-        if any(
-            command_type.is_inline_command(entry)
-            for command_type in get_command_types()
-        ):
+        if find_inline_command_class(entry) is not None:
             return
         if any(key in entry for key in ("command", "path", "name")):
             return
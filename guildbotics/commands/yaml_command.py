@@ -10,6 +10,7 @@ from guildbotics.utils.import_utils import ClassResolver
 class YamlCommand(CommandBase):
     extensions: ClassVar[list[str]] = [".yaml", ".yml"]
     inline_key: ClassVar[str] = ""
+    definition_only: ClassVar[bool] = True
 
     @classmethod
     def populate_spec(
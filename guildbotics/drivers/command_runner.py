@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Sequence
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -25,6 +27,10 @@ __all__ = [
     "run_command",
 ]
 
+# Names of the commands currently executing. Task-local, so children run
+# concurrently each extend their own copy of the chain.
+_CALL_STACK: ContextVar[tuple[str, ...]] = ContextVar("command_call_stack", default=())
+
 
 class CommandRunner:
     """Coordinate the execution of main and sub commands."""
@@ -41,13 +47,17 @@ class CommandRunner:
         self._command_name = command_name
         self._command_args = list(command_args)
         self._registry: dict[str, CommandSpec] = {}
-        self._call_stack: list[str] = []
         self._cwd = cwd if cwd is not None else Path.cwd()
         self._spec_factory = CommandSpecFactory(context)
         self._main_spec = self._prepare_main_spec()
 
     async def run(self) -> str:
-        await self._run_with_children(self._main_spec)
+        # A nested runner starts its own chain instead of inheriting ours.
+        token = _CALL_STACK.set(())
+        try:
+            await self._run_with_children(self._main_spec)
+        finally:
+            _CALL_STACK.reset(token)
         return self._context.pipe
 
     def _prepare_main_spec(self) -> CommandSpec:
@@ -66,20 +76,54 @@ class CommandRunner:
         )
 
         # Run child commands first
-        for child in spec.children:
-            await self._run_with_children(child, spec)
+        if spec.parallel_children and len(spec.children) > 1:
+            await self._run_children_concurrently(spec)
+        else:
+            for child in spec.children:
+                await self._run_with_children(child, spec)
 
         # Run this command
         outcome = await self._run(spec)
         return outcome
 
+    async def _run_children_concurrently(self, spec: CommandSpec) -> None:
+        """Run independent children together, keeping the pipe deterministic.
+
+        Every child, including its nested sub-commands, works on a private copy
+        of the pipe as it was before the group started, and the pipe afterwards
+        holds the output of the last child that produced one, exactly as if the
+        children had run in order. A failing child cancels its siblings before
+        the error propagates.
+        """
+        pipe = self._context.pipe
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [
+                    group.create_task(self._run_branch(child, spec, pipe))
+                    for child in spec.children
+                ]
+        except BaseExceptionGroup as errors:
+            raise errors.exceptions[0] from None
+        outcomes = [task.result() for task in tasks]
+        last = next((o for o in reversed(outcomes) if o is not None), None)
+        self._context.pipe = last.text_output if last is not None else pipe
+
+    async def _run_branch(
+        self, child: CommandSpec, parent: CommandSpec, pipe: str
+    ) -> CommandOutcome | None:
+        self._context.isolate_pipe(pipe)
+        return await self._run_with_children(child, parent)
+
     async def _run(self, spec: CommandSpec) -> CommandOutcome | None:
         name = spec.name
-        if name in self._call_stack:
-            cycle = " -> ".join([*self._call_stack, name])
+        call_stack = _CALL_STACK.get()
+        if name in call_stack:
+            cycle = " -> ".join([*call_stack, name])
             raise CommandError(f"Cyclic command invocation detected: {cycle}")
+        if spec.command_class.definition_only:
+            return None
 
-        self._call_stack.append(name)
+        token = _CALL_STACK.set((*call_stack, name))
 
         try:
             command = spec.command_class(self._context, spec, spec.cwd)
@@ -90,7 +134,7 @@ class CommandRunner:
                 )
             return outcome
         finally:
-            self._call_stack.pop()
+            _CALL_STACK.reset(token)
 
     async def _invoke(self, name: str, *args: Any, **kwargs: Any) -> Any:
         cwd = kwargs.pop("cwd", None)
@@ -107,8 +151,9 @@ class CommandRunner:
         return outcome.result if outcome else None
 
     def _current_spec(self) -> CommandSpec:
-        if self._call_stack:
-            current_name = self._call_stack[-1]
+        call_stack = _CALL_STACK.get()
+        if call_stack:
+            current_name = call_stack[-1]
             current_spec = self._registry.get(current_name)
             if current_spec is not None:
                 return current_spec
@@ -148,7 +193,10 @@ async def run_command(
             raise CommandError(str(exc)) from exc
     context = base_context.clone_for(person)
     try:
-        runner = CommandRunner(context, command_name, command_args, cwd)
+        # Command resolution probes the filesystem; keep it off the event loop.
+        runner = await asyncio.to_thread(
+            CommandRunner, context, command_name, command_args, cwd
+        )
         return await runner.run()
     finally:
         try:
@@ -32,6 +32,9 @@ from guildbotics.runtime.event_listener import (
     IncomingChatEvent,
 )
 
+# Members whose channels are backfilled at the same time in one cycle.
+MAX_CONCURRENT_BACKFILLS = 8
+
 SubscriptionSignature = tuple[tuple[tuple[str, str], ...], ...]
 ResolvedSubscriptions = dict[str, "ChatBackfillPolicy"]
 
@@ -83,6 +86,8 @@ class EventListenerRunner:
         # awaits so a stop overlapping a backfill does not exceed the stop timeout.
         self._loop: asyncio.AbstractEventLoop | None = None
         self._active_cycle: asyncio.Task[None] | None = None
+        # Set by stop() so the idle wait between cycles ends immediately.
+        self._wakeup: asyncio.Event | None = None
         self._listeners: dict[SlackConnectionKey, EventListener] = {}
         self._listener_tokens: dict[SlackConnectionKey, str] = {}
         self._connection_person_ids: dict[SlackConnectionKey, list[str]] = {}
@@ -121,6 +126,10 @@ class EventListenerRunner:
         if loop is not None and cycle is not None:
             with suppress(RuntimeError):
                 loop.call_soon_threadsafe(cycle.cancel)
+        wakeup = self._wakeup
+        if loop is not None and wakeup is not None:
+            with suppress(RuntimeError):
+                loop.call_soon_threadsafe(wakeup.set)
 
     def join(self, timeout: float | None = None) -> None:
         thread = self._thread
@@ -172,6 +181,7 @@ class EventListenerRunner:
                     self._on_stopped()
 
     async def _run_loop(self) -> None:
+        self._wakeup = asyncio.Event()
         while not self._stop_event.is_set():
             self._cycle_count += 1
             try:
@@ -185,7 +195,11 @@ class EventListenerRunner:
                 self._log_warning("event runner cycle failed: %s", exc)
             finally:
                 self._active_cycle = None
-            await asyncio.sleep(self.poll_interval_seconds)
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._wakeup.wait(), timeout=self.poll_interval_seconds
+                )
+        self._wakeup = None
         self._log_info(
             "event listener runner summary: cycles=%d cycle_failures=%d drained=%d "
             "pending=%d backfilled=%d",
@@ -216,6 +230,7 @@ class EventListenerRunner:
             self._log_info(
                 "event listener runner: no active event listener subscriptions"
             )
+        backfill_slots = asyncio.Semaphore(MAX_CONCURRENT_BACKFILLS)
         for key, person_subs in grouped.items():
             if self._stop_event.is_set():
                 break
@@ -247,12 +262,15 @@ class EventListenerRunner:
                         subscriptions[incoming.channel_id].participation,
                     )
                     pending_count += 1
-            # Backfill members concurrently (Slack I/O only). The actual chat
-            # workflow runs later in each member's scheduler worker, which keeps
-            # a member's chat/ticket/scheduled work on one serial queue.
+            # Backfill members concurrently (Slack I/O only), but cap the number
+            # of members in flight so a large team cannot burst the Slack API.
+            # The actual chat workflow runs later in each member's scheduler
+            # worker, which keeps a member's work on one serial queue.
             backfilled_results = await asyncio.gather(
                 *(
-                    self._backfill_person(person, key.service, subscriptions)
+                    self._backfill_person_bounded(
+                        backfill_slots, person, key.service, subscriptions
+                    )
                     for person, subscriptions in person_subs
                 )
             )
@@ -276,6 +294,16 @@ class EventListenerRunner:
                     self._events_backfilled_count,
                 )
 
+    async def _backfill_person_bounded(
+        self,
+        slots: asyncio.Semaphore,
+        person: Person,
+        service: str,
+        subscriptions: ResolvedSubscriptions,
+    ) -> int:
+        async with slots:
+            return await self._backfill_person(person, service, subscriptions)
+
     async def _backfill_person(
         self,
         person: Person,
@@ -4,6 +4,7 @@ import threading
 import time
 from collections.abc import Awaitable, Callable, Coroutine
 from contextlib import suppress
+from functools import partial
 from typing import Any
 
 from guildbotics.drivers.execution import (
@@ -66,6 +67,9 @@ class TaskScheduler:
         self._member_routines_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._cancel_event = threading.Event()
+        # Wake-up callbacks of in-flight cancel waiters, one per worker loop.
+        # Guarded by _member_routines_lock like the other cross-thread state.
+        self._cancel_listeners: set[Callable[[], object]] = set()
         self._threads: list[threading.Thread] = []
         # Queued chat events are executed here, in each member's single worker
         # thread, so a member's chat / ticket / scheduled / routine work shares
@@ -112,7 +116,7 @@ class TaskScheduler:
         """
         self._stop_event.set()
         if not graceful:
-            self._cancel_event.set()
+            self._cancel()
 
     def shutdown(self, graceful: bool = True, timeout: float | None = None) -> None:
         """Signal all worker threads to stop and wait for them.
@@ -243,39 +247,39 @@ class TaskScheduler:
         consecutive_errors: int,
     ) -> tuple[int, bool]:
         """Check and execute scheduled tasks."""
+        # Work for one person stays serial (it shares a workspace); due tasks
+        # run back to back, pacing comes from the once-a-minute cycle.
         for scheduled_task in scheduled_tasks:
             if self._stop_event.is_set():
                 break
-            if scheduled_task.should_run(start_time):
-                with trace_scope(
+            if not scheduled_task.should_run(start_time):
+                continue
+            with trace_scope(
+                "scheduled",
+                person_id=person.person_id,
+                command=scheduled_task.command,
+                attributes={"service_run_id": self.service_run_id},
+            ) as trace:
+                ok = self._run_work(
+                    loop,
+                    person,
                     "scheduled",
-                    person_id=person.person_id,
-                    command=scheduled_task.command,
-                    attributes={"service_run_id": self.service_run_id},
-                ) as trace:
-                    ok = self._run_work(
-                        loop,
-                        person,
-                        "scheduled",
-                        scheduled_task.command,
-                        run_command(context, scheduled_task.command, "scheduled"),
-                        work_id=trace.trace_id,
-                    )
-                consecutive_errors, should_stop = self._update_consecutive_errors(
-                    ok,
+                    scheduled_task.command,
+                    run_command(context, scheduled_task.command, "scheduled"),
+                    work_id=trace.trace_id,
+                )
+            consecutive_errors, should_stop = self._update_consecutive_errors(
+                ok,
+                source="scheduled",
+                consecutive_errors=consecutive_errors,
+            )
+            if should_stop:
+                self._record_worker_failed(
+                    person,
                     source="scheduled",
                     consecutive_errors=consecutive_errors,
                 )
-                if should_stop:
-                    self._record_worker_failed(
-                        person,
-                        source="scheduled",
-                        consecutive_errors=consecutive_errors,
-                    )
-                    return consecutive_errors, True
-            if self._stop_event.is_set():
-                break
-            self._sleep_interruptible(1)
+                return consecutive_errors, True
         return consecutive_errors, False
 
     def _process_routine_tasks(
@@ -455,7 +459,7 @@ class TaskScheduler:
                 person_id=person.person_id,
                 command=command,
                 work_id=work_id,
-                cancel=self._cancel_event.set,
+                cancel=self._cancel,
             ):
                 return self._run(loop, coro)
         except WorkRejectedError as exc:
@@ -493,9 +497,28 @@ class TaskScheduler:
             await task
         return False
 
+    def _cancel(self) -> None:
+        self._cancel_event.set()
+        with self._member_routines_lock:
+            listeners = tuple(self._cancel_listeners)
+        for notify in listeners:
+            # The worker loop may already be closed during shutdown.
+            with suppress(RuntimeError):
+                notify()
+
     async def _wait_for_cancel(self) -> None:
-        while not self._cancel_event.is_set():
-            await asyncio.sleep(0.2)
+        """Wait for a forceful stop without polling the cancel event."""
+        loop = asyncio.get_running_loop()
+        wakeup = asyncio.Event()
+        notify = partial(loop.call_soon_threadsafe, wakeup.set)
+        with self._member_routines_lock:
+            self._cancel_listeners.add(notify)
+        try:
+            if not self._cancel_event.is_set():
+                await wakeup.wait()
+        finally:
+            with self._member_routines_lock:
+                self._cancel_listeners.discard(notify)
 
     async def _process_pending_chat(self, person: Person) -> bool:
         try:
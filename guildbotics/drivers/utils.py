@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import datetime
-import shlex
 import traceback
 from collections.abc import Awaitable, Callable
 from typing import Any
@@ -9,6 +8,7 @@ from typing import Any
 from guildbotics.drivers.command_runner import CommandRunner
 from guildbotics.observability.diagnostics_events import record_correlated_event
 from guildbotics.runtime import Context
+from guildbotics.utils.text_utils import split_command_line
 
 
 async def run_with_logging(
@@ -72,7 +72,7 @@ async def run_command(context: Context, command: str, task_type: str) -> bool:
     """Run a command within the given context and log its execution."""
 
     async def _action() -> None:
-        words = shlex.split(command)
+        words = split_command_line(command)
         if not words:
             raise ValueError(f"Empty or whitespace command string: {command!r}")
         await CommandRunner(context, words[0], words[1:]).run()
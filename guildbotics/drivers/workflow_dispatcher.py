@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import shlex
-
 from guildbotics.drivers.command_runner import CommandRunner
 from guildbotics.entities.team import Person
 from guildbotics.observability import current_trace, set_attributes, trace_scope
@@ -10,6 +8,7 @@ from guildbotics.runtime.workflow_invocation import (
     WORKFLOW_INVOCATION_KEY,
     WorkflowInvocation,
 )
+from guildbotics.utils.text_utils import split_command_line
 
 
 class WorkflowDispatcher:
@@ -49,7 +48,7 @@ class WorkflowDispatcher:
             context.shared_state[WORKFLOW_INVOCATION_KEY] = invocation
 
             try:
-                words = shlex.split(invocation.command)
+                words = split_command_line(invocation.command)
                 if not words:
                     raise ValueError("Empty command string in workflow invocation")
                 await CommandRunner(context, words[0], words[1:]).run()
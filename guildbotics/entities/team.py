@@ -55,6 +55,7 @@ class Project(BaseModel):
     )
 
     _language: Language | None = PrivateAttr(default=None)
+    _language_name: str | None = PrivateAttr(default=None)
 
     def __str__(self):
         return f"Project(name={self.name})"
@@ -136,11 +137,13 @@ class Project(BaseModel):
         Returns:
             str: The name of the project's default language.
         """
-        lang = self._get_language()
-        language_code = lang.language or "en"
-        if language_code in KNOWN_LANGUAGE_NAMES:
-            return KNOWN_LANGUAGE_NAMES[language_code]
-        return lang.display_name(language_code)
+        if self._language_name is None:
+            lang = self._get_language()
+            language_code = lang.language or "en"
+            self._language_name = KNOWN_LANGUAGE_NAMES.get(
+                language_code
+            ) or lang.display_name(language_code)
+        return self._language_name
 
 
 class CommandSchedule(BaseModel):
@@ -282,6 +285,10 @@ class Person(BaseModel):
         default_factory=list, description="A list of routine commands for the person."
     )
 
+    _casefolded_keys: tuple[tuple[str, str], tuple[str, str]] | None = PrivateAttr(
+        default=None
+    )
+
     def __str__(self):
         return f"Person(person_id={self.person_id}, name={self.name})"
 
@@ -295,6 +302,20 @@ class Person(BaseModel):
         """Return hash based on person_id."""
         return hash(self.person_id)
 
+    @property
+    def casefolded_keys(self) -> tuple[str, str]:
+        """Return the casefolded ``(person_id, name)`` used for member lookup.
+
+        The result is memoized against the raw values, so assigning a new id or
+        name (or copying with an update) recomputes it.
+        """
+        source = (self.person_id, self.name)
+        cached = self._casefolded_keys
+        if cached is None or cached[0] != source:
+            cached = (source, (source[0].casefold(), source[1].casefold()))
+            self._casefolded_keys = cached
+        return cached[1]
+
     def get_scheduled_commands(self) -> list[ScheduledCommand]:
         """
         Get a list of scheduled commands for the person.
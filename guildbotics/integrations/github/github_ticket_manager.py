@@ -639,9 +639,10 @@ class GitHubTicketManager(TicketManager):
         stripped = text.rstrip()
         if not stripped:
             return ""
-        lines = stripped.splitlines()
-        if lines and lines[-1].strip() == signature:
-            return "\n".join(lines[:-1])
+        # Only the last line is inspected, so split it off instead of every line.
+        head, _, last_line = stripped.rpartition("\n")
+        if last_line.strip() == signature:
+            return head.rstrip("\r")
         return text
 
     def _text_mentions_me(
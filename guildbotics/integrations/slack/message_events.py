@@ -23,3 +23,9 @@ def is_conversational_message(raw: dict[str, Any]) -> bool:
 
 def is_bot_message(raw: dict[str, Any]) -> bool:
     return bool(raw.get("bot_id")) or get_message_subtype(raw) == "bot_message"
+
+
+def is_blank_message(text: str, metadata: dict[str, object]) -> bool:
+    # Blank messages (e.g. attachment-only shares) carry nothing a workflow
+    # could answer; workflow status markers are kept regardless.
+    return not text.strip() and not metadata
@@ -20,6 +20,7 @@ from guildbotics.integrations.chat_workflow_status import (
 )
 from guildbotics.integrations.slack.auth_errors import is_slack_auth_error
 from guildbotics.integrations.slack.message_events import (
+    is_blank_message,
     is_bot_message,
     is_conversational_message,
 )
@@ -338,8 +339,11 @@ class SlackChatService(ChatService):
     def _to_event(self, channel_id: str, raw: dict[str, Any]) -> ChatEvent | None:
         if not is_conversational_message(raw):
             return None
-        author_id = _str_or_none(raw.get("user"))
         text = str(raw.get("text", "") or "")
+        metadata = normalize_workflow_status_metadata(raw.get("metadata"))
+        if is_blank_message(text, metadata):
+            return None
+        author_id = _str_or_none(raw.get("user"))
         thread_ts = _str_or_none(raw.get("thread_ts")) or str(raw.get("ts", "") or "")
         message_ts = str(raw.get("ts", "") or "")
         event_id = f"{channel_id}:{message_ts}"
@@ -353,7 +357,7 @@ class SlackChatService(ChatService):
             mentions=_extract_mentions(text),
             is_bot_message=is_bot_message(raw),
             is_thread_reply=thread_ts != message_ts,
-            metadata=normalize_workflow_status_metadata(raw.get("metadata")),
+            metadata=metadata,
         )
 
 
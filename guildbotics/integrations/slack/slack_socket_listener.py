@@ -18,6 +18,7 @@ from guildbotics.integrations.chat_workflow_status import (
 )
 from guildbotics.integrations.slack.auth_errors import is_slack_auth_error
 from guildbotics.integrations.slack.message_events import (
+    is_blank_message,
     is_bot_message,
     is_conversational_message,
 )
@@ -231,6 +232,10 @@ class SlackSocketEventListener(EventListener):
             return None
         if str(event.get("type", "")) != "message":
             return None
+        # Edits, deletions and other non-conversational subtypes are dropped
+        # before the rest of the event is read.
+        if not is_conversational_message(event):
+            return None
 
         channel_id = str(event.get("channel", "") or "")
         if not channel_id:
@@ -239,9 +244,10 @@ class SlackSocketEventListener(EventListener):
         if not ts:
             return None
         thread_ts = _str_or_none(event.get("thread_ts")) or ts
-        if not is_conversational_message(event):
-            return None
         text = str(event.get("text", "") or "")
+        metadata = normalize_workflow_status_metadata(event.get("metadata"))
+        if is_blank_message(text, metadata):
+            return None
         author_id = _str_or_none(event.get("user"))
         chat_event = ChatEvent(
             event_id=f"{channel_id}:{ts}",
@@ -253,7 +259,7 @@ class SlackSocketEventListener(EventListener):
             mentions=_extract_mentions(text),
             is_bot_message=is_bot_message(event),
             is_thread_reply=(thread_ts != ts),
-            metadata=normalize_workflow_status_metadata(event.get("metadata")),
+            metadata=metadata,
         )
         return IncomingChatEvent(
             service_name="slack", channel_id=channel_id, event=chat_event
@@ -12,6 +12,7 @@ channels it adds on top of the standard ones.
 from __future__ import annotations
 
 import asyncio
+import heapq
 from contextlib import suppress
 from logging import getLogger
 from typing import Any
@@ -1047,7 +1048,7 @@ def _reject_option_id(options: Any) -> str:
 
 def _payload_fields(payload: dict[str, Any]) -> list[str]:
     """Return the payload's top-level field names, never its values."""
-    return sorted(str(key)[:_MAX_FIELD_NAME] for key in payload)[:_MAX_FIELDS]
+    return heapq.nsmallest(_MAX_FIELDS, (str(key)[:_MAX_FIELD_NAME] for key in payload))
 
 
 def non_negative_int(value: Any) -> int | None:
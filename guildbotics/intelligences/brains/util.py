@@ -39,19 +39,22 @@ def to_plain_text(
     user_input: str | None,
     response_class: type[BaseModel] | None = None,
 ) -> str:
-    plain_text = ""
+    # Collect sections and join once so large prompts are copied a single time.
+    sections: list[str] = []
 
     if description:
-        plain_text += f"{description}\n\n"
+        sections.append(description)
 
     if response_class:
         schema_dict = response_class.model_json_schema()
-        plain_text += f"<{response_class.__name__} Schema>\n```json\n{json.dumps(schema_dict, indent=2)}\n```\n</{response_class.__name__} Schema>\n\n"
+        sections.append(
+            f"<{response_class.__name__} Schema>\n```json\n{json.dumps(schema_dict, indent=2)}\n```\n</{response_class.__name__} Schema>"
+        )
 
     if user_input:
-        plain_text += f"<Conversation>\n{user_input}\n</Conversation>\n\n"
+        sections.append(f"<Conversation>\n{user_input}\n</Conversation>")
 
-    return textwrap.dedent(plain_text).strip()
+    return textwrap.dedent("\n\n".join(sections)).strip()
 
 
 def to_response_class(
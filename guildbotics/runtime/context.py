@@ -1,7 +1,9 @@
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
+from contextvars import ContextVar
 from copy import deepcopy
 from logging import Logger
+from types import MappingProxyType
 from typing import Any
 
 from pydantic import BaseModel
@@ -18,6 +20,16 @@ from guildbotics.utils.i18n_tool import set_language
 from guildbotics.utils.import_utils import ClassResolver
 from guildbotics.utils.log_utils import get_logger
 
+# Pipes of contexts running inside parallel branches, keyed by context identity.
+# Task-local, so concurrent siblings each keep their own pipe instead of
+# overwriting the shared one; the branching context outlives its branch tasks,
+# so its id cannot be reused while an entry exists.
+_BRANCH_PIPES: ContextVar[Mapping[int, str]] = ContextVar(
+    "context_branch_pipes", default=MappingProxyType({})
+)
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 class Context:
     """
@@ -55,10 +67,30 @@ class Context:
         self.task = task
         self.ticket_manager: TicketManager | None = None
         self.chat_service: ChatService | None = None
-        self.pipe = message
+        self._pipe = message
         self.shared_state: dict[str, Any] = {}
         self._invoker: Callable[[str, Any], Awaitable[Any]] | None = None
 
+    @property
+    def pipe(self) -> str:
+        return _BRANCH_PIPES.get().get(id(self), self._pipe)
+
+    @pipe.setter
+    def pipe(self, value: str) -> None:
+        branch_pipes = _BRANCH_PIPES.get()
+        if id(self) in branch_pipes:
+            _BRANCH_PIPES.set({**branch_pipes, id(self): value})
+        else:
+            self._pipe = value
+
+    def isolate_pipe(self, value: str) -> None:
+        """
+        Give the calling task a private pipe starting from the given value.
+        Args:
+            value (str): The pipe the branch starts with.
+        """
+        _BRANCH_PIPES.set({**_BRANCH_PIPES.get(), id(self): value})
+
     @property
     def language_code(self) -> str:
         return self.team.project.get_language_code()
@@ -195,6 +227,9 @@ class Context:
             if isinstance(value[0], BaseModel):
                 return [item.model_dump() for item in value]
         if isinstance(value, dict):
+            # A flat dict of immutable scalars needs only a shallow copy.
+            if all(type(item) in _SCALAR_TYPES for item in value.values()):
+                return value.copy()
             return deepcopy(value)
         return value
 
@@ -58,21 +58,28 @@ def resolve_person(
 
 
 def find_person(members: Sequence[Person], identifier: str) -> Person | None:
+    """Find a member by id, falling back to the first member with that name.
+
+    Both comparisons are case-insensitive and share a single pass over members.
+    """
     lower_identifier = identifier.casefold()
+    name_match: Person | None = None
     for member in members:
-        if member.person_id.casefold() == lower_identifier:
-            return member
-    for member in members:
-        if member.name.casefold() == lower_identifier:
+        person_key, name_key = member.casefolded_keys
+        if person_key == lower_identifier:
             return member
-    return None
+        if name_match is None and name_key == lower_identifier:
+            name_match = member
+    return name_match
 
 
 def list_person_labels(members: Sequence[Person]) -> list[str]:
     labels: list[str] = []
     for member in members:
-        label = member.person_id
-        if member.name and member.name.casefold() != member.person_id.casefold():
-            label = f"{label} ({member.name})"
-        labels.append(label)
+        person_id, name = member.person_id, member.name
+        person_key, name_key = member.casefolded_keys
+        if name and name_key != person_key:
+            labels.append(f"{person_id} ({name})")
+        else:
+            labels.append(person_id)
     return sorted(labels)
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 from contextlib import suppress
@@ -110,6 +111,13 @@ async def _build_task_error_message(
         return error_text
 
 
+async def _ticket_url_or_fallback(ticket_manager: TicketManager, task: Task) -> str:
+    try:
+        return await ticket_manager.get_ticket_url(task, markdown=False)
+    except Exception:
+        return task.url or f"task:{task.id}"
+
+
 def _work_type(task: Task) -> str:
     if task.pull_request_url:
         return "pull_request_review"
@@ -162,10 +170,7 @@ async def _handle_ticket_rate_limit(
     retry_after: WorkflowRateLimit,
 ) -> None:
     """Post a rate-limit comment on the ticket and record the event."""
-    try:
-        ticket_url = await ticket_manager.get_ticket_url(task, markdown=False)
-    except Exception:
-        ticket_url = task.url or f"task:{task.id}"
+    ticket_url = await _ticket_url_or_fallback(ticket_manager, task)
 
     message = workflow_rate_limit_notice_text(retry_after)
     body = render_workflow_status_comment(
@@ -194,9 +199,11 @@ async def _handle_ticket_rate_limit(
 async def _main(
     context: Context, ticket_manager: TicketManager, run_id: str
 ) -> AgentResponse:
-    await _move_task_to_working_if_ready(context, ticket_manager)
-
-    ticket_url = await ticket_manager.get_ticket_url(context.task, markdown=False)
+    # The lane move and the URL lookup are independent remote calls.
+    _, ticket_url = await asyncio.gather(
+        _move_task_to_working_if_ready(context, ticket_manager),
+        ticket_manager.get_ticket_url(context.task, markdown=False),
+    )
     workspace_data_root = get_workspace_data_root()
     member_workspace = workspace_data_root / "workspaces" / context.person.person_id
     member_workspace.mkdir(parents=True, exist_ok=True)
@@ -328,11 +335,10 @@ async def main(context: Context) -> AgentResponse | None:
                 message=_rate_limited_summary(rate_limit),
                 skip_ticket_comment=True,
             )
-        message = await _build_task_error_message(context, error)
-        try:
-            ticket_url = await ticket_manager.get_ticket_url(task, markdown=False)
-        except Exception:
-            ticket_url = task.url or f"task:{task.id}"
+        message, ticket_url = await asyncio.gather(
+            _build_task_error_message(context, error),
+            _ticket_url_or_fallback(ticket_manager, task),
+        )
         message = render_workflow_status_comment(
             body=message,
             payload=workflow_status_comment_payload(
@@ -1,4 +1,6 @@
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -247,6 +249,7 @@ def load_markdown_with_frontmatter(file: Path) -> dict:
     """
     Load a Markdown file with YAML front matter and return as dict.
     Front matter keys are parsed as key-value pairs, and the body is stored under 'body'.
+    Parsed files are memoized by path, mtime and size; each call returns a private copy.
 
     Args:
         file (Path): Path to the Markdown file.
@@ -254,7 +257,14 @@ def load_markdown_with_frontmatter(file: Path) -> dict:
     Returns:
         dict: Parsed front matter with 'body' key for the markdown body.
     """
-    with file.open("r", encoding="utf-8") as f:
+    stat = file.stat()
+    cached = _parse_markdown_with_frontmatter(str(file), stat.st_mtime_ns, stat.st_size)
+    return copy.deepcopy(cached)
+
+
+@lru_cache(maxsize=256)
+def _parse_markdown_with_frontmatter(file: str, mtime_ns: int, size: int) -> dict:
+    with open(file, encoding="utf-8") as f:
         content = f.read()
 
     # Split front matter and body, tolerating different newline styles
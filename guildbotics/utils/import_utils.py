@@ -104,14 +104,14 @@ class ClassResolver:
     ) -> dict[str, type[BaseModel]]:
         lines = []
         for line in schema.splitlines():
-            stripped = line.lstrip()
+            # Only top-level bare class headers are patched; checking the raw
+            # line avoids an lstrip() copy of every schema line.
             if (
-                stripped.startswith("class ")
-                and stripped.endswith(":")
-                and not stripped.endswith("(BaseModel):")
-                and line == stripped
+                line.startswith("class ")
+                and line.endswith(":")
+                and not line.endswith("(BaseModel):")
             ):
-                name = stripped[len("class ") : -1].strip()
+                name = line[len("class ") : -1].strip()
                 lines.append(f"class {name}(BaseModel):")
             else:
                 lines.append(line)
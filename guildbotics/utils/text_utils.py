@@ -1,48 +1,72 @@
 import re
+import shlex
+from functools import lru_cache
 from typing import Any
 
 import jinja2
 
+_JINJA2_ENV = jinja2.Environment(trim_blocks=True, lstrip_blocks=True)
+_JSON_FENCE_RE = re.compile(r"```json\s*(\{[\s\S]*\})\s*```")
+# Characters that make shlex parsing differ from a plain whitespace split.
+_SHLEX_SPECIAL_CHARS = frozenset("\"'\\")
+# Default-engine placeholder forms; the last group is the bare ``$name`` form.
+_PLACEHOLDER_RE = re.compile(
+    r"\{\{([^{}]+)\}\}|\$\{([^{}]+)\}|\{([^{}]+)\}|\$([^\s${}]+)"
+)
+_BARE_PLACEHOLDER_GROUP = 4
+
+
+def split_command_line(text: str) -> list[str]:
+    """Split a command line like ``shlex.split``, skipping the tokenizer when
+    the text has no quotes or escapes (non-ASCII text may hold other spaces).
+    """
+    if text.isascii() and _SHLEX_SPECIAL_CHARS.isdisjoint(text):
+        return text.split()
+    return shlex.split(text)
 
-def get_json_str(raw_output: str) -> str:
-    # Try to find a fenced JSON block first
-    match = re.search(r"```json\s*(\{[\s\S]*\})\s*```", raw_output)
-    if match:
-        json_str = match.group(1)
-    else:
-        # Fallback: extract first {…} JSON substring
-        start = raw_output.find("{")
-        end = raw_output.rfind("}") + 1
-        if start != -1 and end != -1:
-            json_str = raw_output[start:end]
-        else:
-            return raw_output.strip()
-    return json_str.strip()
-
-
-def _replace_placeholders(
-    text: str, placeholders: dict[str, Any], placeholder: str
-) -> str:
-    for key, value in placeholders.items():
-        var_name = placeholder.format(key)
-        if var_name in text:
-            text = text.replace(var_name, str(value))
 
-    return text
+def get_json_str(raw_output: str) -> str:
+    # Try to find a fenced JSON block first; the substring test skips the regex
+    # scan for the common unfenced output.
+    if "```json" in raw_output:
+        match = _JSON_FENCE_RE.search(raw_output)
+        if match:
+            return match.group(1).strip()
+    # Fallback: extract from the first "{" to the last "}" after it
+    start = raw_output.find("{")
+    end = raw_output.rfind("}", start + 1) + 1 if start != -1 else 0
+    if not end:
+        return raw_output.strip()
+    return raw_output[start:end].strip()
 
 
 def replace_placeholders_by_default(text: str, placeholders: dict[str, Any]) -> str:
-    text = _replace_placeholders(text, placeholders, "{{{{{}}}}}")
-    text = _replace_placeholders(text, placeholders, "${{{}}}")
-    text = _replace_placeholders(text, placeholders, "{{{}}}")
-    text = _replace_placeholders(text, placeholders, "${}")
-    return text
+    """Substitute ``{{key}}``, ``${key}``, ``{key}`` and ``$key`` in one pass."""
+    if not placeholders or ("{" not in text and "$" not in text):
+        return text
+
+    def _substitute(match: re.Match[str]) -> str:
+        index = match.lastindex or 0
+        name = match[index]
+        if index != _BARE_PLACEHOLDER_GROUP:
+            return str(placeholders[name]) if name in placeholders else match[0]
+        # A bare $name ends at the longest known key, so "$arg10" prefers
+        # "arg10" over "arg1" and "$name." keeps the trailing text.
+        for end in range(len(name), 0, -1):
+            if name[:end] in placeholders:
+                return str(placeholders[name[:end]]) + name[end:]
+        return match[0]
+
+    return _PLACEHOLDER_RE.sub(_substitute, text)
+
+
+@lru_cache(maxsize=512)
+def _compile_jinja2_template(text: str) -> jinja2.Template:
+    return _JINJA2_ENV.from_string(text)
 
 
 def replace_placeholders_by_jinja2(text: str, placeholders: dict[str, Any]) -> str:
-    env = jinja2.Environment(trim_blocks=True, lstrip_blocks=True)
-    template = env.from_string(text)
-    return template.render(**placeholders)
+    return _compile_jinja2_template(text).render(**placeholders)
 
 
 def replace_placeholders(
@@ -59,12 +83,12 @@ def get_placeholders_from_args(
 ) -> dict[str, str]:
     placeholders = {}
     for i, arg in enumerate(args, 1):
-        kv = arg.split("=", 1)
-        if len(kv) > 1:
-            placeholders[kv[0]] = kv[1]
+        key, sep, value = arg.partition("=")
+        if sep:
+            placeholders[key] = value
         elif add_index:
-            placeholders[f"arg{i}"] = str(arg)
-            placeholders[f"{i}"] = str(arg)
+            placeholders[f"arg{i}"] = arg
+            placeholders[f"{i}"] = arg
     return placeholders
 
 
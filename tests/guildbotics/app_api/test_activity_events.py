@@ -0,0 +1,7 @@
+from guildbotics.app_api.activity_events import commit_message
+
+
+def test_commit_message_returns_subject_line_only():
+    assert commit_message({"message": "\n Fix bug\r\n\r\nLong body\n"}) == "Fix bug"
+    assert commit_message({"message": "Single line"}) == "Single line"
+    assert commit_message({"message": None}) == ""
@@ -6,6 +6,7 @@ import pytest
 
 import guildbotics.cli as cli_module
 from guildbotics.cli import _parse_command_spec
+from guildbotics.commands import shell_script_command
 from guildbotics.commands.errors import CommandError
 from guildbotics.drivers.command_runner import (
     CommandRunner,
@@ -133,25 +134,130 @@ def test_resolve_person_raises_when_unknown():
         resolve_person(team, "akira", allow_default=True)
 
 
-class RecordingBrain:
-    def __init__(self, name: str) -> None:
-        self.name = name
-        self.calls: list[str] = []
-        self.response_class = None
-
-    async def run(self, message: str, **_: object) -> str:
-        self.calls.append(message)
-        return f"{self.name}:{message}"
-
-
 def _write(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(textwrap.dedent(content).strip() + "\n", encoding="utf-8")
 
 
+@pytest.fixture(scope="module")
+def shared_config_dir(tmp_path_factory) -> Path:
+    """Command tree written once and shared by the tests that only read it."""
+    config_dir = tmp_path_factory.mktemp("run_command")
+    commands = config_dir / "commands"
+    _write(
+        commands / "solo.md",
+        """
+        ---
+        brain: none
+        template_engine: jinja2
+        ---
+        Greetings {{ arg1 }}
+        {{ context.pipe }}
+        """,
+    )
+    _write(
+        commands / "whoami.md",
+        """
+        ---
+        brain: none
+        template_engine: jinja2
+        ---
+        {{ context.person.person_id }}
+        """,
+    )
+    _write(
+        commands / "pipeline.md",
+        """
+        ---
+        brain: none
+        commands:
+          - name: first_payload
+            path: first.md
+          - name: python_payload
+            path: tools/python_step.py
+            params:
+              foo: bar
+        ---
+        Main start for {{1}}
+        """,
+    )
+    _write(
+        commands / "first.md",
+        """
+        ---
+        brain: default
+        ---
+        First step
+        """,
+    )
+    _write(
+        commands / "tools/python_step.py",
+        """
+        from guildbotics.runtime import Context
+
+
+        async def main(context: Context, foo: str):
+            return {"pipe": context.pipe, "foo": foo}
+        """,
+    )
+    _write(
+        commands / "shell_driver.md",
+        """
+        ---
+        brain: none
+        commands:
+          - name: shell_output
+            path: tools/echo.sh
+            params:
+              foo: bar
+            args:
+            - alpha
+            - beta
+        ---
+        Shell body {{1}}
+        """,
+    )
+    # Only resolved by discovery; the shell test stubs the subprocess.
+    _write(commands / "tools/echo.sh", "#!/usr/bin/env bash")
+    (commands / "tools/echo.sh").chmod(0o755)
+    _write(
+        commands / "driver.py",
+        """
+        from guildbotics.runtime import Context
+
+        async def main(context: Context):
+            await context.invoke("invoked_md", "value")
+            return {
+                "invoked": context.shared_state.get("invoked_md"),
+                "stdin": context.pipe,
+            }
+        """,
+    )
+    _write(
+        commands / "invoked_md.md",
+        """
+        ---
+        brain: none
+        ---
+        Placeholder {{1}}
+        """,
+    )
+    return config_dir
+
+
+@pytest.fixture
+def config_dir(shared_config_dir: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("GUILDBOTICS_CONFIG_DIR", str(shared_config_dir))
+    return shared_config_dir
+
+
+# Runs never mutate the team or its members, so the models are built once.
+_ALICE = Person(person_id="alice", name="Alice", is_active=True)
+_ALICE_TEAM = _team(_ALICE)
+
+
 def _get_context(message: str = "") -> Context:
-    person = Person(person_id="alice", name="Alice", is_active=True)
-    return _context_for_team(_team(person), message).clone_for(person)
+    return _context_for_team(_ALICE_TEAM, message).clone_for(_ALICE)
 
 
 def _context_for_person(person: Person, message: str = "") -> Context:
@@ -168,37 +274,13 @@ def _context_for_team(team: Team, message: str = "") -> Context:
 
 
 @pytest.mark.asyncio
-async def test_run_custom_command_returns_brain_output(tmp_path, monkeypatch):
-    monkeypatch.setenv("GUILDBOTICS_CONFIG_DIR", str(tmp_path))
-    _write(
-        tmp_path / "commands/solo.md",
-        """
-        ---
-        brain: none
-        template_engine: jinja2
-        ---
-        Greetings {{ arg1 }}
-        {{ context.pipe }}
-        """,
-    )
-
+async def test_run_custom_command_returns_brain_output(config_dir):
     result = await run_command(_get_context("stdin text"), "solo", ["world"])
     assert result == "Greetings world\nstdin text"
 
 
 @pytest.mark.asyncio
-async def test_run_command_runs_as_configured_default_person(tmp_path, monkeypatch):
-    monkeypatch.setenv("GUILDBOTICS_CONFIG_DIR", str(tmp_path))
-    _write(
-        tmp_path / "commands/whoami.md",
-        """
-        ---
-        brain: none
-        template_engine: jinja2
-        ---
-        {{ context.person.person_id }}
-        """,
-    )
+async def test_run_command_runs_as_configured_default_person(config_dir):
     team = _team(
         Person(person_id="yuki", name="Yuki", is_active=True),
         Person(person_id="akira", name="Akira", is_active=True),
@@ -252,17 +334,7 @@ async def test_cli_run_rejects_human_member_without_traceback(
 
 
 @pytest.mark.asyncio
-async def test_run_custom_command_rejects_human_member(tmp_path, monkeypatch):
-    monkeypatch.setenv("GUILDBOTICS_CONFIG_DIR", str(tmp_path))
-    _write(
-        tmp_path / "commands/solo.md",
-        """
-        ---
-        brain: none
-        ---
-        Greetings
-        """,
-    )
+async def test_run_custom_command_rejects_human_member(config_dir):
     human = Person(
         person_id="aiko",
         name="Aiko",
@@ -276,44 +348,7 @@ async def test_run_custom_command_rejects_human_member(tmp_path, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_executor_runs_markdown_with_subcommands(tmp_path, monkeypatch):
-    monkeypatch.setenv("GUILDBOTICS_CONFIG_DIR", str(tmp_path))
-    _write(
-        tmp_path / "commands/pipeline.md",
-        """
-        ---
-        brain: none
-        commands:
-          - name: first_payload
-            path: first.md
-          - name: python_payload
-            path: tools/python_step.py
-            params:
-              foo: bar
-        ---
-        Main start for {{1}}
-        """,
-    )
-    _write(
-        tmp_path / "commands/first.md",
-        """
-        ---
-        brain: default
-        ---
-        First step
-        """,
-    )
-    _write(
-        tmp_path / "commands/tools/python_step.py",
-        """
-        from guildbotics.runtime import Context
-
-
-        async def main(context: Context, foo: str):
-            return {"pipe": context.pipe, "foo": foo}
-        """,
-    )
-
+async def test_executor_runs_markdown_with_subcommands(config_dir):
     context = _get_context("initial")
     executor = CommandRunner(context, "pipeline", ["ARG"])
     result = await executor.run()
@@ -329,42 +364,31 @@ async def test_executor_runs_markdown_with_subcommands(tmp_path, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_executor_runs_shell_command(tmp_path, monkeypatch):
-    monkeypatch.setenv("GUILDBOTICS_CONFIG_DIR", str(tmp_path))
-    _write(
-        tmp_path / "commands/shell_driver.md",
-        """
-        ---
-        brain: none
-        commands:
-          - name: shell_output
-            path: tools/echo.sh
-            params:
-              foo: bar
-            args:
-            - alpha
-            - beta
-        ---
-        Shell body {{1}}
-        """,
+async def test_executor_runs_shell_command(config_dir, monkeypatch):
+    class _FakeProcess:
+        returncode = 0
+
+        def __init__(self, argv: tuple[str, ...], env: dict[str, str]) -> None:
+            self._argv = argv
+            self._env = env
+
+        async def communicate(self, stdin: bytes | None) -> tuple[bytes, bytes]:
+            stdin_text = (stdin or b"").decode()
+            stdout = (
+                f"args:{' '.join(self._argv[1:])}\n"
+                f"stdin:{stdin_text}\n"
+                f"FOO={self._env.get('foo', 'missing')}\n"
+            )
+            return stdout.encode(), b""
+
+    async def fake_exec(*argv: str, env: dict[str, str], **_: object):
+        assert argv[0].endswith("tools/echo.sh")
+        return _FakeProcess(argv, env)
+
+    monkeypatch.setattr(
+        shell_script_command.asyncio, "create_subprocess_exec", fake_exec
     )
 
-    script_path = tmp_path / "commands/tools/echo.sh"
-    script_path.parent.mkdir(parents=True, exist_ok=True)
-    script_path.write_text(
-        """
-        #!/usr/bin/env bash
-        set -euo pipefail
-
-        echo "args:$*"
-        echo "stdin:$(cat)"
-        echo "FOO=${foo:-missing}"
-        """.strip()
-        + "\n",
-        encoding="utf-8",
-    )
-    script_path.chmod(0o755)
-
     context = _get_context("initial")
     executor = CommandRunner(context, "shell_driver", ["ARG"])
     result = await executor.run()
@@ -378,31 +402,7 @@ async def test_executor_runs_shell_command(tmp_path, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_python_command_can_invoke_subcommand(tmp_path, monkeypatch):
-    monkeypatch.setenv("GUILDBOTICS_CONFIG_DIR", str(tmp_path))
-    _write(
-        tmp_path / "commands/driver.py",
-        """
-        from guildbotics.runtime import Context
-
-        async def main(context: Context):
-            await context.invoke("invoked_md", "value")
-            return {
-                "invoked": context.shared_state.get("invoked_md"),
-                "stdin": context.pipe,
-            }
-        """,
-    )
-    _write(
-        tmp_path / "commands/invoked_md.md",
-        """
-        ---
-        brain: none
-        ---
-        Placeholder {{1}}
-        """,
-    )
-
+async def test_python_command_can_invoke_subcommand(config_dir):
     context = _get_context()
     executor = CommandRunner(context, "driver", [])
     await executor.run()
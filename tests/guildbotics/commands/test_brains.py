@@ -0,0 +1,13 @@
+import pytest
+
+from guildbotics.commands.brains import is_brain_disabled
+
+
+@pytest.mark.parametrize("value", ["none", "-", "null", "disabled", " None ", None])
+def test_is_brain_disabled_accepts_sentinels(value: object):
+    assert is_brain_disabled(value) is True
+
+
+@pytest.mark.parametrize("value", ["", "default", "fast", False, 0])
+def test_is_brain_disabled_rejects_other_values(value: object):
+    assert is_brain_disabled(value) is False
@@ -0,0 +1,54 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+
+from guildbotics.commands.models import CommandSpec
+from guildbotics.commands.print_command import PrintCommand
+
+
+def test_invocation_options_resolve_only_sigil_prefixed_values(monkeypatch):
+    monkeypatch.setenv("GB_TEST_TOKEN", "from-env")
+    context = SimpleNamespace(pipe="piped", shared_state={"step": {"out": 42}})
+    spec = CommandSpec(
+        name="print",
+        base_dir=Path("."),
+        command_class=PrintCommand,
+        cwd=Path("."),
+        params={"plain": "a$b", "env": "$GB_TEST_TOKEN", "count": 3},
+        args=["literal", "${step.out}", 7],
+    )
+
+    options = PrintCommand(cast(Any, context), spec, Path(".")).options
+
+    assert options.params == {"plain": "a$b", "env": "from-env", "count": 3}
+    assert options.args == ["literal", "42", 7]
+    assert options.message == "piped"
+    assert spec.params["env"] == "$GB_TEST_TOKEN"
+
+
+def test_placeholder_forms_match_braced_and_bare_syntax():
+    context = SimpleNamespace(pipe="", shared_state={"step": {"out": "v"}, "k": 1})
+    spec = CommandSpec(
+        name="print",
+        base_dir=Path("."),
+        command_class=PrintCommand,
+        cwd=Path("."),
+        args=["${ step.out }", "$k", "${k", "$k}", "$step.missing", "${}"],
+    )
+
+    options = PrintCommand(cast(Any, context), spec, Path(".")).options
+
+    assert options.args == ["v", "1", "{k", "k}", "step.missing", ""]
+
+
+def test_invocation_options_without_params_or_args_are_fresh_containers():
+    context = SimpleNamespace(pipe="", shared_state={})
+    spec = CommandSpec(
+        name="print", base_dir=Path("."), command_class=PrintCommand, cwd=Path(".")
+    )
+
+    options = PrintCommand(cast(Any, context), spec, Path(".")).options
+    options.params["added"] = 1
+
+    assert options.args == []
+    assert spec.params == {}
@@ -180,3 +180,13 @@ def test_reserved_metadata_files_are_not_command_candidates(
     )
 
     assert result == []
+
+
+def test_resolve_skips_missing_directories_and_keeps_precedence(
+    command_env: SimpleNamespace,
+) -> None:
+    # Member and shared command roots do not exist; the template must still win.
+    template = _template(command_env, "solo.md")
+
+    assert discovery.resolve_command_path("solo", "en", person_id="ghost") == template
+    assert discovery.resolve_command_path("absent", "en", person_id="ghost") is None
@@ -0,0 +1,30 @@
+import pytest
+
+from guildbotics.commands.errors import CommandError
+from guildbotics.commands.markdown_command import MarkdownCommand
+from guildbotics.commands.print_command import PrintCommand
+from guildbotics.commands.registry import find_command_class, find_inline_command_class
+from guildbotics.commands.shell_script_command import ShellScriptCommand
+from guildbotics.commands.yaml_command import YamlCommand
+
+
+def test_find_command_class_is_case_insensitive():
+    assert find_command_class(".md") is MarkdownCommand
+    assert find_command_class(".MD") is MarkdownCommand
+    assert find_command_class(".Yml") is YamlCommand
+
+
+def test_find_command_class_rejects_unknown_extension_every_time():
+    for _ in range(2):
+        with pytest.raises(CommandError, match="Unknown command type: '.txt'"):
+            find_command_class(".TXT")
+
+
+def test_find_inline_command_class_follows_registration_order():
+    assert find_inline_command_class({"script": "echo hi"}) is ShellScriptCommand
+    assert find_inline_command_class({"print": "x"}) is PrintCommand
+    assert find_inline_command_class({"print": "x", "prompt": "y"}) is MarkdownCommand
+
+
+def test_find_inline_command_class_ignores_non_inline_entries():
+    assert find_inline_command_class({"path": "child", "": "x"}) is None
@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from guildbotics.commands import shell_script_command
+
+
+def _acquire_path(script: str):
+    with shell_script_command._inline_script_path(script) as path:
+        return path
+
+
+def test_inline_script_file_is_reused_until_removed():
+    script = "echo reused-inline-script\n"
+
+    first = _acquire_path(script)
+    second = _acquire_path(script)
+    first.unlink()
+    recreated = _acquire_path(script)
+
+    assert second == first
+    assert recreated.read_text(encoding="utf-8") == script
+    assert _acquire_path("echo other\n") != recreated
+
+
+def test_inline_script_cache_evicts_and_unlinks_oldest_body(monkeypatch):
+    monkeypatch.setattr(shell_script_command, "_MAX_INLINE_SCRIPTS", 2)
+
+    oldest = _acquire_path("echo evict-1\n")
+    _acquire_path("echo evict-2\n")
+    _acquire_path("echo evict-3\n")
+
+    assert not oldest.exists()
+    assert "echo evict-1\n" not in shell_script_command._INLINE_SCRIPT_PATHS
+
+
+def test_inline_script_path_survives_eviction_while_in_use(monkeypatch):
+    monkeypatch.setattr(shell_script_command, "_MAX_INLINE_SCRIPTS", 1)
+
+    with shell_script_command._inline_script_path("echo in-use\n") as in_use:
+        _acquire_path("echo evict-other\n")
+
+        assert "echo in-use\n" not in shell_script_command._INLINE_SCRIPT_PATHS
+        assert in_use.read_text(encoding="utf-8") == "echo in-use\n"
+
+    assert not in_use.exists()
+
+
+def test_inline_script_concurrent_callers_share_one_file():
+    script = "echo concurrent-inline-script\n"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        paths = set(pool.map(_acquire_path, [script] * 32))
+
+    assert len(paths) == 1
+    assert paths.pop().read_text(encoding="utf-8") == script
@@ -0,0 +1,75 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from guildbotics.commands.errors import CommandError
+from guildbotics.commands.models import CommandSpec
+from guildbotics.commands.spec_factory import CommandSpecFactory
+from guildbotics.commands.yaml_command import YamlCommand
+
+
+def _factory() -> CommandSpecFactory:
+    return CommandSpecFactory(cast(Any, SimpleNamespace()))
+
+
+@pytest.mark.parametrize(
+    ("entry", "expected"),
+    [
+        ("report a=1  b=2", {"path": "report", "args": ["a=1", "b=2"]}),
+        ("report 'a b' c", {"path": "report", "args": ["a b", "c"]}),
+        ('report "x=1 2"', {"path": "report", "args": ["x=1 2"]}),
+        ("report a\\ b", {"path": "report", "args": ["a b"]}),
+        ("report\u3000memo", {"path": "report\u3000memo", "args": []}),
+    ],
+)
+def test_parse_command_matches_shell_word_splitting(entry, expected):
+    assert _factory()._parse_command(entry) == expected
+
+
+def test_parse_command_rejects_blank_entry():
+    with pytest.raises(CommandError, match="cannot be empty"):
+        _factory()._parse_command("   ")
+
+
+def test_placeholders_from_args_stringify_non_string_values():
+    factory = _factory()
+
+    assert factory._get_placeholders_from_args([1, "a=2"], ".md") == {
+        "arg1": "1",
+        "1": "1",
+        "a": "2",
+    }
+    assert factory._get_placeholders_from_args(["x", "b=3"], ".py") == {"b": "3"}
+
+
+def test_merge_params_layers_anchor_entry_and_arg_params():
+    anchor = CommandSpec(
+        name="main",
+        base_dir=Path("."),
+        command_class=YamlCommand,
+        cwd=Path("."),
+        params={"a": "anchor", "b": "anchor"},
+    )
+    factory = _factory()
+
+    assert factory._merge_params(anchor, [], {"b": "entry"}, ".md") == {
+        "a": "anchor",
+        "b": "entry",
+    }
+    assert factory._merge_params(anchor, ["b=arg", "x"], None, ".md") == {
+        "a": "anchor",
+        "b": "arg",
+        "arg2": "x",
+        "2": "x",
+    }
+
+
+def test_placeholders_from_args_returns_independent_dicts():
+    factory = _factory()
+
+    first = factory._get_placeholders_from_args(["a=1"], ".md")
+    first["a"] = "changed"
+
+    assert factory._get_placeholders_from_args(["a=1"], ".md") == {"a": "1"}
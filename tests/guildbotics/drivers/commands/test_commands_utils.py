@@ -12,3 +12,28 @@ def test_stringify_output_handles_model_and_primitives():
     assert "value: ok" in stringify_output(model_output)
     assert stringify_output({"a": 1}) == "a: 1"
     assert stringify_output(["foo", "bar"]) == "foo\nbar"
+
+
+def test_stringify_output_handles_subclasses_and_nested_models():
+    class _Text(str):
+        pass
+
+    class _Mapping(dict):
+        pass
+
+    assert stringify_output(None) == ""
+    assert stringify_output(_Text("plain")) == "plain"
+    assert stringify_output(_Mapping(a=1)) == "a: 1"
+    assert "value: ok" in stringify_output([_SampleModel(value="ok")])
+    assert stringify_output(42) == "42"
+
+
+def test_stringify_output_dispatches_model_subclasses_consistently():
+    class _Derived(_SampleModel):
+        extra: int = 1
+
+    first = stringify_output(_Derived(value="ok"))
+    second = stringify_output(_Derived(value="ok"))
+
+    assert first == second
+    assert "extra: 1" in first
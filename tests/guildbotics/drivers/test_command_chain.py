@@ -24,13 +24,16 @@ on native libraries.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import os
 import sys
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from guildbotics.commands import python_command
 from guildbotics.commands.errors import (
     CommandError,
     PersonNotFoundError,
@@ -140,6 +143,95 @@ async def test_pipe_flows_as_stdin_into_each_command(config_dir: Path):
     assert ctx.pipe.strip() == "HELLO"
 
 
+@pytest.mark.asyncio
+async def test_shell_command_reads_eof_when_pipe_is_empty(config_dir: Path):
+    (config_dir / "commands" / "drain.sh").write_text(
+        "#!/usr/bin/env bash\ncat\necho drained\n", encoding="utf-8"
+    )
+
+    ctx = await _run_main(config_dir, "drain", message="")
+
+    assert ctx.shared_state["drain"] == "drained\n"
+
+
+@pytest.mark.asyncio
+async def test_parallel_children_share_input_and_keep_declared_pipe_order(
+    config_dir: Path,
+):
+    commands = config_dir / "commands"
+    # Each child blocks until the other has started, so they must overlap.
+    (commands / "fan.yml").write_text(
+        "parallel: true\n"
+        "commands:\n"
+        "  - name: slow\n"
+        "    script: touch slow.started; while [ ! -e fast.started ]; do sleep 0.01;"
+        ' done; echo "slow:$(cat)"\n'
+        "  - name: fast\n"
+        "    script: touch fast.started; while [ ! -e slow.started ]; do sleep 0.01;"
+        ' done; echo "fast:$(cat)"\n',
+        encoding="utf-8",
+    )
+
+    ctx = await asyncio.wait_for(_run_main(config_dir, "fan", message="in"), 10)
+
+    assert ctx.shared_state["slow"] == "slow:in\n"
+    assert ctx.shared_state["fast"] == "fast:in\n"
+    assert ctx.pipe == "fast:in\n"
+
+
+@pytest.mark.asyncio
+async def test_parallel_branch_sub_commands_keep_their_own_pipe(config_dir: Path):
+    commands = config_dir / "commands"
+    (commands / "fan.yml").write_text(
+        "parallel: true\ncommands:\n  - branch_a\n  - b_out\n", encoding="utf-8"
+    )
+    (commands / "branch_a.yml").write_text("commands:\n  - a_inner\n", encoding="utf-8")
+    # The grandchild reads the pipe only after the sibling branch updated its own.
+    (commands / "a_inner.py").write_text(
+        "import asyncio\n"
+        "async def main(context):\n"
+        "    while 'b_out' not in context.shared_state:\n"
+        "        await asyncio.sleep(0.01)\n"
+        "    return 'inner saw:' + context.pipe\n",
+        encoding="utf-8",
+    )
+    (commands / "b_out.py").write_text(
+        "def main():\n    return 'B-OUT'\n", encoding="utf-8"
+    )
+
+    ctx = await asyncio.wait_for(_run_main(config_dir, "fan", message="in"), 10)
+
+    assert ctx.shared_state["a_inner"] == "inner saw:in"
+    assert ctx.pipe == "B-OUT"
+
+
+@pytest.mark.asyncio
+async def test_parallel_child_failure_cancels_siblings(config_dir: Path):
+    commands = config_dir / "commands"
+    (commands / "fan.yml").write_text(
+        "parallel: true\ncommands:\n  - late\n  - boom\n", encoding="utf-8"
+    )
+    (commands / "late.py").write_text(
+        "import asyncio\n"
+        "async def main(context):\n"
+        "    await asyncio.sleep(0.2)\n"
+        "    context.shared_state['late'] = True\n",
+        encoding="utf-8",
+    )
+    (commands / "boom.py").write_text(
+        "def main():\n    raise ValueError('child exploded')\n", encoding="utf-8"
+    )
+
+    ctx = _make_context("seed")
+    runner = CommandRunner(ctx, "fan", [], cwd=config_dir)
+
+    with pytest.raises(ValueError, match="child exploded"):
+        await runner.run()
+    await asyncio.sleep(0.3)
+
+    assert "late" not in ctx.shared_state
+
+
 # --- child command failure -> parent never runs ----------------------------
 
 
@@ -211,6 +303,28 @@ async def test_yaml_nested_commands_execute_depth_first(config_dir: Path):
     assert ctx.pipe == "leaf"
 
 
+@pytest.mark.asyncio
+async def test_yaml_command_is_never_instantiated(
+    config_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """YAML definitions only contribute children; no command object is built."""
+    from guildbotics.commands.yaml_command import YamlCommand
+
+    def fail(*_args: Any) -> None:
+        raise AssertionError("YamlCommand must not be instantiated")
+
+    monkeypatch.setattr(YamlCommand, "__init__", fail)
+    commands = config_dir / "commands"
+    (commands / "leaf.py").write_text(
+        "def main():\n    return 'leaf'\n", encoding="utf-8"
+    )
+    (commands / "root.yml").write_text("commands:\n  - leaf\n", encoding="utf-8")
+
+    ctx = await _run_main(config_dir, "root", ["$unused"])
+
+    assert ctx.pipe == "leaf"
+
+
 # --- Markdown frontmatter options ------------------------------------------
 
 
@@ -231,6 +345,25 @@ async def test_markdown_brain_disabled_renders_placeholders(config_dir: Path):
     assert ctx.pipe == "Name is Ada"
 
 
+@pytest.mark.asyncio
+async def test_markdown_brain_disabled_params_override_shared_state(config_dir: Path):
+    """Command params win over shared_state, and session keys are injected."""
+    commands = config_dir / "commands"
+    (commands / "render.md").write_text(
+        "---\nbrain: none\n---\n$name/$today\n", encoding="utf-8"
+    )
+
+    ctx = _make_context()
+    ctx.shared_state["name"] = "Ada"
+    runner = CommandRunner(ctx, "render", ["name=Bob"], cwd=config_dir)
+    await runner.run()
+
+    name, today = ctx.pipe.split("/")
+    assert name == "Bob"
+    assert today != "$today"
+    assert "today" not in ctx.shared_state
+
+
 @pytest.mark.asyncio
 async def test_markdown_declared_arguments_apply_defaults(config_dir: Path):
     commands = config_dir / "commands"
@@ -278,6 +411,22 @@ async def test_markdown_empty_body_returns_none(config_dir: Path):
     assert ctx.pipe == "keep"
 
 
+@pytest.mark.asyncio
+async def test_markdown_reparses_only_after_file_changes(config_dir: Path):
+    """Repeated runs reuse the parsed file until its mtime changes."""
+    path = config_dir / "commands" / "greet.md"
+    path.write_text("---\nbrain: none\n---\nHello\n", encoding="utf-8")
+
+    assert (await _run_main(config_dir, "greet")).pipe == "Hello"
+    assert (await _run_main(config_dir, "greet")).pipe == "Hello"
+
+    path.write_text("---\nbrain: none\n---\nGoodbye\n", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert (await _run_main(config_dir, "greet")).pipe == "Goodbye"
+
+
 # --- Python command async vs sync, context/positional/keyword binding ------
 
 
@@ -294,6 +443,85 @@ async def test_python_sync_main_returns_value(config_dir: Path):
     assert ctx.pipe == "sync-result"
 
 
+@pytest.mark.asyncio
+async def test_python_module_executes_once_per_file_version(config_dir: Path):
+    script = config_dir / "commands" / "counter.py"
+    script.write_text(
+        "LOADS = []\nLOADS.append(1)\n\ndef main():\n    return len(LOADS)\n",
+        encoding="utf-8",
+    )
+
+    first = await _run_main(config_dir, "counter")
+    second = await _run_main(config_dir, "counter")
+    script.write_text(
+        "LOADS = [1, 2]\n\ndef main():\n    return len(LOADS)\n", encoding="utf-8"
+    )
+    stat = script.stat()
+    os.utime(script, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    edited = await _run_main(config_dir, "counter")
+
+    assert first.shared_state["counter"] == 1
+    assert second.shared_state["counter"] == 1
+    assert edited.shared_state["counter"] == 2
+
+
+@pytest.mark.asyncio
+async def test_python_entry_signature_is_inspected_once(
+    config_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    (config_dir / "commands" / "sig_cmd.py").write_text(
+        "def main(first, *, flag='off'):\n    return f'{first}:{flag}'\n",
+        encoding="utf-8",
+    )
+    calls: list[object] = []
+    real_signature = python_command.inspect.signature
+
+    def counting_signature(obj, *args, **kwargs):
+        if getattr(obj, "__module__", None) == "sig_cmd":
+            calls.append(obj)
+        return real_signature(obj, *args, **kwargs)
+
+    monkeypatch.setattr(python_command.inspect, "signature", counting_signature)
+
+    first = await _run_main(config_dir, "sig_cmd", args=["a", "flag=on"])
+    second = await _run_main(config_dir, "sig_cmd", args=["b"])
+
+    assert first.shared_state["sig_cmd"] == "a:on"
+    assert second.shared_state["sig_cmd"] == "b:off"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_python_main_may_be_an_unhashable_callable(config_dir: Path):
+    (config_dir / "commands" / "dc_cmd.py").write_text(
+        "from dataclasses import dataclass\n"
+        "@dataclass\n"
+        "class Greeter:\n"
+        "    greeting: str\n"
+        "    def __call__(self, name):\n"
+        "        return f'{self.greeting} {name}'\n"
+        "main = Greeter('hi')\n",
+        encoding="utf-8",
+    )
+
+    ctx = await _run_main(config_dir, "dc_cmd", args=["bob"])
+
+    assert ctx.shared_state["dc_cmd"] == "hi bob"
+
+
+@pytest.mark.asyncio
+async def test_python_main_var_keyword_receives_unmatched_params(config_dir: Path):
+    (config_dir / "commands" / "kw_cmd.py").write_text(
+        "def main(first, *, flag, **rest):\n"
+        "    return f'{first}:{flag}:{sorted(rest.items())}'\n",
+        encoding="utf-8",
+    )
+
+    ctx = await _run_main(config_dir, "kw_cmd", args=["a", "flag=on", "extra=x"])
+
+    assert ctx.shared_state["kw_cmd"] == "a:on:[('extra', 'x')]"
+
+
 @pytest.mark.asyncio
 async def test_python_async_main_is_awaited(config_dir: Path):
     commands = config_dir / "commands"
@@ -364,6 +592,20 @@ async def test_shell_receives_params_as_env(config_dir: Path):
     assert ctx.shared_state["env_echo"].strip() == "from-env"
 
 
+@pytest.mark.asyncio
+async def test_shell_without_params_inherits_current_environment(
+    config_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setenv("GB_INHERITED", "from-process")
+    (config_dir / "commands" / "inherit.sh").write_text(
+        '#!/usr/bin/env bash\necho "$GB_INHERITED"\n', encoding="utf-8"
+    )
+
+    ctx = await _run_main(config_dir, "inherit")
+
+    assert ctx.shared_state["inherit"].strip() == "from-process"
+
+
 @pytest.mark.asyncio
 async def test_shell_nonzero_exit_includes_stderr(config_dir: Path):
     commands = config_dir / "commands"
@@ -405,6 +647,24 @@ async def test_inline_print_renders_with_jinja2_in_chain(config_dir: Path):
     assert ctx.pipe == "Hello world!"
 
 
+@pytest.mark.asyncio
+async def test_inline_print_ignores_brain_and_template_engine(config_dir: Path):
+    """print always renders locally with jinja2 whatever the entry declares."""
+    commands = config_dir / "commands"
+    (commands / "printer.yml").write_text(
+        "commands:\n"
+        "  - name: greeting\n"
+        "    brain: default\n"
+        "    template_engine: default\n"
+        "    print: '{% if name %}Hi {{ name }}{% endif %}'\n",
+        encoding="utf-8",
+    )
+
+    ctx = await _run_main(config_dir, "printer", ["name=Ada"])
+
+    assert ctx.pipe == "Hi Ada"
+
+
 @pytest.mark.asyncio
 async def test_inline_to_html_in_chain(config_dir: Path):
     commands = config_dir / "commands"
@@ -549,3 +809,29 @@ async def test_run_command_selects_single_active_member(config_dir: Path):
     )
 
     assert result == "alice"
+
+
+@pytest.mark.asyncio
+async def test_run_command_resolves_the_command_off_the_event_loop(
+    config_dir: Path, monkeypatch: pytest.MonkeyPatch
+):
+    import threading
+
+    from guildbotics.drivers import command_runner
+
+    (config_dir / "commands" / "noop.py").write_text(
+        "def main():\n    return 'x'\n", encoding="utf-8"
+    )
+    threads: list[threading.Thread] = []
+    real_resolve = command_runner.resolve_named_command
+
+    def tracking_resolve(context, identifier):
+        threads.append(threading.current_thread())
+        return real_resolve(context, identifier)
+
+    monkeypatch.setattr(command_runner, "resolve_named_command", tracking_resolve)
+
+    result = await run_command(_make_context(), "noop", [], cwd=config_dir)
+
+    assert result == "x"
+    assert threads and threads[0] is not threading.current_thread()
@@ -8,6 +8,7 @@ from guildbotics.drivers.command_runner import CommandRunner
 
 
 class DummyCommand:
+    definition_only = False
     last_cwd = None
 
     def __init__(self, context, spec, cwd):
@@ -965,6 +965,52 @@ async def test_run_once_uses_connection_service_for_backfill(monkeypatch):
     assert observed_backfill_services == ["slack-compatible"]
 
 
+@pytest.mark.asyncio
+async def test_run_once_caps_concurrent_member_backfills(monkeypatch):
+    import asyncio
+
+    from guildbotics.drivers import event_listener_runner
+
+    runner = EventListenerRunner(_FakeContext())  # type: ignore[arg-type]
+    key = SlackConnectionKey(
+        service="slack",
+        event_source="socket_mode",
+        app_token_hash="h" * 64,
+        base_url="https://slack.example/api",
+    )
+    people = [Person(person_id=f"p{i}", name=f"P{i}") for i in range(5)]
+    in_flight = 0
+    peak = 0
+
+    class _FakeListener:
+        def start(self):
+            return None
+
+        def drain_events(self):
+            return []
+
+    async def _grouped():
+        return {key: [(person, {}) for person in people]}
+
+    async def _fake_backfill_person(person, service, subscriptions):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return 1
+
+    monkeypatch.setattr(event_listener_runner, "MAX_CONCURRENT_BACKFILLS", 2)
+    monkeypatch.setattr(runner, "_build_person_subscriptions_by_connection", _grouped)
+    monkeypatch.setattr(runner, "_get_or_create_listener", lambda key: _FakeListener())
+    monkeypatch.setattr(runner, "_backfill_person", _fake_backfill_person)
+
+    await runner._run_once()
+
+    assert peak == 2
+    assert runner._events_backfilled_count == len(people)
+
+
 @pytest.mark.asyncio
 async def test_backfill_tracking_is_scoped_by_service_name(monkeypatch):
     ctx = _FakeContext()
@@ -1231,3 +1277,29 @@ async def test_stop_cancels_in_flight_cycle(monkeypatch):
     await asyncio.wait_for(loop_task, timeout=1.0)
     assert runner._stop_event.is_set()
     assert runner._cycle_failure_count == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_wakes_runner_waiting_between_cycles(monkeypatch):
+    import asyncio
+
+    runner = EventListenerRunner(  # type: ignore[arg-type]
+        _FakeContext(), poll_interval_seconds=30
+    )
+    runner._loop = asyncio.get_running_loop()
+    cycles = asyncio.Event()
+
+    async def _quick_run_once():
+        cycles.set()
+
+    monkeypatch.setattr(runner, "_run_once", _quick_run_once)
+
+    loop_task = asyncio.create_task(runner._run_loop())
+    await asyncio.wait_for(cycles.wait(), timeout=1.0)
+    await asyncio.sleep(0)
+
+    runner.stop()
+
+    # The idle wait ends on stop instead of sleeping out the poll interval.
+    await asyncio.wait_for(loop_task, timeout=1.0)
+    assert runner._cycle_count == 1
@@ -1,4 +1,6 @@
+import asyncio
 import datetime as dt
+import threading
 from types import SimpleNamespace
 
 import pytest
@@ -411,7 +413,7 @@ async def test_run_cancellable_cancels_long_task_on_force_stop() -> None:
     task = asyncio.ensure_future(scheduler._run_cancellable(_long()))
     await asyncio.wait_for(started.wait(), timeout=1.0)
 
-    scheduler._cancel_event.set()
+    scheduler.request_shutdown(graceful=False)
 
     result = await asyncio.wait_for(task, timeout=1.0)
     assert result is False
@@ -475,3 +477,45 @@ def test_run_work_lease_conflict_skips_without_stopping_scheduler(monkeypatch) -
 
     assert ok is True
     assert not scheduler._stop_event.is_set()
+
+
+def test_scheduled_tasks_run_back_to_back_without_pausing(monkeypatch) -> None:
+    person = _Person()
+    scheduler = TaskScheduler(_Context(person))
+    sleeps: list[float] = []
+    ran: list[str] = []
+
+    async def fake_run_command(context, command, task_type) -> bool:
+        ran.append(command)
+        return True
+
+    monkeypatch.setattr(task_scheduler, "run_command", fake_run_command)
+    monkeypatch.setattr(scheduler, "_sleep_interruptible", sleeps.append)
+    idle = [
+        SimpleNamespace(command=f"idle{i}", should_run=lambda now: False)
+        for i in range(3)
+    ]
+    due = SimpleNamespace(command="due", should_run=lambda now: True)
+
+    loop = asyncio.new_event_loop()
+    try:
+        result = scheduler._process_scheduled_tasks(
+            loop, _Context(person), person, [*idle, due], dt.datetime.now(), 0
+        )
+    finally:
+        loop.close()
+
+    assert result == (0, False)
+    assert ran == ["due"]
+    assert sleeps == []
+
+
+def test_force_stop_from_another_thread_wakes_cancel_waiter() -> None:
+    scheduler = TaskScheduler(_Context(_Person()))
+
+    async def _run() -> object:
+        threading.Timer(0.05, scheduler.request_shutdown, (False,)).start()
+        return await scheduler._run_cancellable(asyncio.sleep(30, True))
+
+    assert asyncio.run(asyncio.wait_for(_run(), timeout=1.0)) is False
+    assert scheduler._cancel_listeners == set()
@@ -1,6 +1,5 @@
-import asyncio
+from collections import deque
 from types import SimpleNamespace
-from typing import List
 
 import pytest
 
@@ -12,14 +11,15 @@ class StubLogger:
     """Minimal logger capturing info/error messages for assertions."""
 
     def __init__(self) -> None:
-        self.infos: List[str] = []
-        self.errors: List[str] = []
+        # Bounded so traceback-heavy failure paths cannot grow without limit.
+        self.infos: deque[str] = deque(maxlen=64)
+        self.errors: deque[str] = deque(maxlen=64)
 
     def info(self, msg: str) -> None:  # pragma: no cover - trivial
-        self.infos.append(str(msg))
+        self.infos.append(msg)
 
     def error(self, msg: str) -> None:  # pragma: no cover - trivial
-        self.errors.append(str(msg))
+        self.errors.append(msg)
 
 
 class FakeContext:
@@ -45,8 +45,7 @@ async def test_run_command_success_logs_and_returns_true(monkeypatch):
             self.args = args
 
         async def run(self):
-            # Simulate successful command execution
-            await asyncio.sleep(0)
+            return None
 
     monkeypatch.setattr("guildbotics.drivers.utils.CommandRunner", FakeCommandRunner)
     monkeypatch.setattr(
@@ -58,14 +57,12 @@ async def test_run_command_success_logs_and_returns_true(monkeypatch):
     ok = await run_command(ctx, "test", task_type="scheduled")
     assert ok is True
     # Validate logs contain start and finish messages
-    start_logs = [
-        m for m in ctx.logger.infos if "Running scheduled command 'test'" in m
-    ]
-    finish_logs = [
-        m for m in ctx.logger.infos if "Finished running scheduled command 'test'" in m
-    ]
-    assert start_logs, "Start log not found"
-    assert finish_logs, "Finish log not found"
+    assert any("Running scheduled command 'test'" in m for m in ctx.logger.infos), (
+        "Start log not found"
+    )
+    assert any(
+        "Finished running scheduled command 'test'" in m for m in ctx.logger.infos
+    ), "Finish log not found"
     assert [event["event_type"] for event in events] == [
         "command.started",
         "command.finished",
@@ -88,7 +85,6 @@ async def test_run_command_exception_logs_and_returns_false(monkeypatch):
             self.args = args
 
         async def run(self):
-            await asyncio.sleep(0)
             raise RuntimeError("boom")
 
     monkeypatch.setattr(
@@ -103,12 +99,12 @@ async def test_run_command_exception_logs_and_returns_false(monkeypatch):
     ok = await run_command(ctx, "Failing", task_type="scheduled")
     assert ok is False
     # Validate error summary and traceback were logged
-    error_summary = [
-        e for e in ctx.logger.errors if "Error running scheduled command 'Failing'" in e
-    ]
-    assert error_summary, "Error summary log not found"
-    traceback_logs = [e for e in ctx.logger.errors if "RuntimeError: boom" in e]
-    assert traceback_logs, "Traceback log not found"
+    assert any(
+        "Error running scheduled command 'Failing'" in e for e in ctx.logger.errors
+    ), "Error summary log not found"
+    assert any("RuntimeError: boom" in e for e in ctx.logger.errors), (
+        "Traceback log not found"
+    )
     assert [event["event_type"] for event in events] == [
         "command.started",
         "command.failed",
@@ -76,6 +76,8 @@ def test_project_get_language_name_falls_back_to_langcodes_for_other_languages()
         name = project.get_language_name()
         assert isinstance(name, str) and name.strip() != ""
         assert name == "French"
+        # The resolved name is memoized on the project.
+        assert project.get_language_name() == "French"
         mock_lang.display_name.assert_called_once_with("fr")
 
 
@@ -109,6 +111,21 @@ def test_person_get_scheduled_tasks_expands_all_schedules():
     assert sorted(s.schedule for s in scheduled) == sorted(schedules)
 
 
+def test_person_casefolded_keys_are_memoized_and_follow_updates():
+    person = Person(person_id="Straße", name="ALICE")
+
+    assert person.casefolded_keys == ("strasse", "alice")
+    assert person.casefolded_keys is person.casefolded_keys
+    assert "casefolded_keys" not in person.model_dump()
+
+    assert person.model_copy(update={"name": "Bob"}).casefolded_keys == (
+        "strasse",
+        "bob",
+    )
+    person.name = "Carol"
+    assert person.casefolded_keys == ("strasse", "carol")
+
+
 def test_person_get_role_descriptions_filters_when_ids_provided():
     person = Person(
         person_id="u1",
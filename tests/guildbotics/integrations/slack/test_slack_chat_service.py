@@ -117,6 +117,43 @@ async def test_list_channel_events_normalizes_messages():
     await client.aclose()
 
 
+@pytest.mark.asyncio
+async def test_list_channel_events_ignores_blank_text():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = {
+            "ok": True,
+            "messages": [
+                {
+                    "type": "message",
+                    "subtype": "file_share",
+                    "user": "UUSER1",
+                    "text": " \n",
+                    "ts": "100.1",
+                },
+                {
+                    "type": "message",
+                    "subtype": "bot_message",
+                    "bot_id": "B1",
+                    "text": "",
+                    "ts": "101.1",
+                    "metadata": {
+                        "event_type": "guildbotics.workflow_status",
+                        "event_payload": {"routing": "suppress"},
+                    },
+                },
+            ],
+        }
+        return httpx.Response(200, json=body)
+
+    client = _client_for(handler)
+    svc = SlackChatService(
+        logging.getLogger("test"), client=client, base_url="https://x.test"
+    )
+    page = await svc.list_channel_events("C1")
+    assert [ev.event_id for ev in page.events] == ["C1:101.1"]
+    await client.aclose()
+
+
 @pytest.mark.asyncio
 async def test_list_thread_events_uses_conversations_replies():
     seen_body = ""
@@ -255,6 +255,33 @@ def test_to_incoming_event_ignores_non_conversational_subtypes():
     assert listener._to_incoming_event(channel_join) is None
 
 
+def test_to_incoming_event_ignores_blank_text():
+    listener = SlackSocketEventListener(
+        logger=_dummy_logger(),
+        app_token="xapp-test",
+        http_client=httpx.Client(
+            transport=httpx.MockTransport(lambda _req: httpx.Response(500))
+        ),
+        ws_connect=lambda _url: _FakeSocket([]),
+    )
+
+    blank = {
+        "type": "events_api",
+        "payload": {
+            "event": {
+                "type": "message",
+                "subtype": "file_share",
+                "channel": "C1",
+                "user": "U1",
+                "ts": "100.1",
+                "text": " \n",
+            }
+        },
+    }
+
+    assert listener._to_incoming_event(blank) is None
+
+
 def test_to_incoming_event_keeps_conversational_subtypes():
     listener = SlackSocketEventListener(
         logger=_dummy_logger(),
@@ -1274,3 +1274,13 @@ async def test_latest_assignment_wins_when_both_paths_assign_this_member():
 
     assert task is not None
     assert task.trigger_reason == "working_lane"
+
+
+def test_strip_signature_line_removes_only_a_trailing_signature():
+    manager = _agent_manager()
+
+    assert manager._strip_signature_line(
+        "a\r\nb\r\n<!-- sig -->\n", "<!-- sig -->"
+    ) == ("a\r\nb")
+    assert manager._strip_signature_line("<!-- sig -->", "<!-- sig -->") == ""
+    assert manager._strip_signature_line("a\nb", "<!-- sig -->") == "a\nb"
@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+
+from guildbotics.intelligences.brains.util import to_plain_text
+
+
+class _Answer(BaseModel):
+    value: str
+
+
+def test_to_plain_text_joins_sections_with_blank_lines():
+    text = to_plain_text("Describe it.", "hello", _Answer)
+
+    description, schema, conversation = text.split("\n\n", 2)
+    assert description == "Describe it."
+    assert schema.startswith("<_Answer Schema>\n```json\n{")
+    assert schema.endswith("```\n</_Answer Schema>")
+    assert conversation == "<Conversation>\nhello\n</Conversation>"
+
+
+def test_to_plain_text_skips_empty_sections():
+    assert to_plain_text("", "hi") == "<Conversation>\nhi\n</Conversation>"
+    assert to_plain_text("  indented\n  body\n", None) == "indented\nbody"
+    assert to_plain_text(None, None) == ""
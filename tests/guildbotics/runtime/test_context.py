@@ -263,6 +263,31 @@ def test_update_task_replaces_task():
     assert ctx.get_ticket_manager() is ticket_manager
 
 
+def test_update_copies_dict_results_into_shared_state():
+    team = _make_team(language="en")
+    person = Person(person_id="p1", name="Tester")
+    ctx = Context(
+        loader_factory=DummyLoaderFactory(team),
+        integration_factory=DummyIntegrationFactory(),
+        brain_factory=DummyBrainFactory(),
+        logger=logging.getLogger("test"),
+        person=person,
+        task=Task(title="T", description="D"),
+        message="",
+    )
+    flat = {"status": "ok", "count": 2, "missing": None}
+    nested = {"items": [1, 2], "meta": {"k": "v"}}
+
+    ctx.update("flat", flat, "")
+    ctx.update("nested", nested, "")
+    flat["status"] = "changed"
+    nested["items"].append(3)
+    nested["meta"]["k"] = "changed"
+
+    assert ctx.shared_state["flat"] == {"status": "ok", "count": 2, "missing": None}
+    assert ctx.shared_state["nested"] == {"items": [1, 2], "meta": {"k": "v"}}
+
+
 def test_get_brain_delegates_to_factory_with_language():
     """get_brain delegates to factory and passes derived language code."""
     # Project language code 'ja' should be passed through to BrainFactory
@@ -5,6 +5,8 @@ from guildbotics.entities.team import Person, Project, Team
 from guildbotics.runtime import member_context as member_context_module
 from guildbotics.runtime.member_context import (
     ensure_execution_subject,
+    find_person,
+    list_person_labels,
     resolve_member_context,
 )
 
@@ -64,3 +66,26 @@ def test_resolve_member_context_clones_for_agent_member(monkeypatch):
 
     assert person.person_id == "aiko"
     assert context.person is person
+
+
+def test_find_person_prefers_id_match_over_earlier_name_match():
+    named_alice = Person(person_id="bob", name="Alice")
+    alice = Person(person_id="alice", name="Someone")
+    carol = Person(person_id="carol", name="Carol")
+
+    assert find_person([named_alice, alice], "ALICE") is alice
+    assert find_person([named_alice, alice, carol], "carol") is carol
+    assert find_person([alice, carol], "CAROL") is carol
+    assert find_person([alice, named_alice], "someone") is alice
+    assert find_person([alice], "unknown") is None
+
+
+def test_list_person_labels_adds_only_distinct_names():
+    members = [
+        Person(person_id="zed", name="Zed"),
+        Person(person_id="aiko", name="Aiko Tanaka"),
+        Person(person_id="bot", name=""),
+        Person(person_id="kai", name="kai"),
+    ]
+
+    assert list_person_labels(members) == ["aiko (Aiko Tanaka)", "bot", "kai", "zed"]
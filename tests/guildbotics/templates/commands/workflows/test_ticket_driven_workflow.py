@@ -1,3 +1,4 @@
+import asyncio
 import os
 from pathlib import Path
 
@@ -176,6 +177,30 @@ async def test_run_delegates_ready_ticket_to_cli_agent_and_moves_to_working(
     assert "guildbotics member context --person aiko" in kwargs["workflow_contract"]
 
 
+@pytest.mark.asyncio
+async def test_run_overlaps_lane_move_with_ticket_url_lookup():
+    task = Task(id="1", title="T", description="D", status=Task.READY)
+    url_requested = asyncio.Event()
+
+    class _OverlapTicketManager(StubTicketManager):
+        async def move_ticket(self, task: Task, status: str) -> bool:
+            # Completes only if the URL lookup was started alongside the move.
+            await asyncio.wait_for(url_requested.wait(), timeout=1.0)
+            return await super().move_ticket(task, status)
+
+        async def get_ticket_url(self, task: Task, markdown: bool = True):
+            url_requested.set()
+            return await super().get_ticket_url(task, markdown)
+
+    tm = _OverlapTicketManager(task)
+    ctx = StubContext(task, tm)
+
+    await ticket_driven_workflow.main(ctx)
+
+    assert tm.moved == [(task, Task.IN_PROGRESS)]
+    assert ctx.task.status == Task.IN_PROGRESS
+
+
 @pytest.mark.asyncio
 async def test_move_to_working_keeps_status_when_move_is_noop():
     task = Task(id="1", title="T", description="D", status=Task.READY)
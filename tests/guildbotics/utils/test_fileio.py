@@ -35,6 +35,20 @@ def test_load_markdown_with_frontmatter_handles_newlines(tmp_path, newline):
     assert metadata["body"] == "Body text"
 
 
+def test_load_markdown_with_frontmatter_returns_private_copies(tmp_path):
+    """Cached parses are copied per call and refreshed when the file changes."""
+    path = tmp_path / "prompt.md"
+    path.write_text("---\ntags: [a]\n---\nBody\n", encoding="utf-8")
+
+    first = load_markdown_with_frontmatter(path)
+    first["tags"].append("mutated")
+    assert load_markdown_with_frontmatter(path)["tags"] == ["a"]
+
+    path.write_text("---\ntags: [a, b]\n---\nNew body\n", encoding="utf-8")
+    reloaded = load_markdown_with_frontmatter(path)
+    assert reloaded == {"tags": ["a", "b"], "body": "New body"}
+
+
 def test_find_package_subdir_templates_exists():
     """find_package_subdir returns an existing 'templates' directory from package root."""
     p = find_package_subdir(Path("templates"))
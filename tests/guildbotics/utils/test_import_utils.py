@@ -21,6 +21,7 @@ if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
 from guildbotics.utils.import_utils import (
+    ClassResolver,
     instantiate_class,
     load_class,
     load_function,
@@ -151,3 +152,21 @@ def test_instantiate_class_expected_type_mismatch(dummy_module: str) -> None:
     with pytest.raises(TypeError) as exc:
         instantiate_class(f"{dummy_module}.DummyClass", expected_type=dict)
     assert "Expected instance of type dict" in str(exc.value)
+
+
+def test_class_resolver_patches_only_top_level_bare_class_headers() -> None:
+    """Bare top-level class headers become BaseModel subclasses."""
+
+    schema = (
+        "class Item:\n"
+        "    name: str\n"
+        "\n"
+        "class Basket(BaseModel):\n"
+        "    items: list[Item]\n"
+    )
+
+    resolver = ClassResolver(schema)
+
+    basket = resolver.model_classes["Basket"](items=[{"name": "apple"}])
+    assert basket.items[0].name == "apple"
+    assert set(resolver.model_classes) == {"Item", "Basket"}
@@ -1,6 +1,13 @@
+import shlex
+
 import pytest
 
-from guildbotics.utils.text_utils import get_json_str
+from guildbotics.utils.text_utils import (
+    get_json_str,
+    get_placeholders_from_args,
+    replace_placeholders,
+    split_command_line,
+)
 
 
 def test_get_json_str_with_fenced_json_block():
@@ -43,8 +50,80 @@ def test_get_json_str_boundary_first_to_last_brace():
     assert out == '{ "a": 1 } mid {"b": 2}'
 
 
+def test_get_json_str_unbalanced_braces_return_trimmed_original():
+    """Without a closing brace after the first opening one, nothing is cut."""
+    assert get_json_str(' { "a": 1 ') == '{ "a": 1'
+    assert get_json_str(" } stray { ") == "} stray {"
+
+
 def test_get_json_str_fenced_non_json_language_falls_back():
     """Non-json fenced block should not match the json fence regex and should fall back."""
     raw = 'before text\n```txt\n{\n  "k": "v"\n}\n```\nafter text\n'
     out = get_json_str(raw)
     assert out == '{\n  "k": "v"\n}'
+
+
+def test_replace_placeholders_jinja2_reuses_template_with_fresh_params():
+    """The same jinja2 body renders each call's placeholders, not a cached result."""
+    body = "{% for item in items %}\n- {{ item }}\n{% endfor %}\n"
+
+    assert replace_placeholders(body, {"items": ["a"]}, "jinja2") == "- a\n"
+    assert replace_placeholders(body, {"items": ["b", "c"]}, "jinja2") == "- b\n- c\n"
+
+
+def test_replace_placeholders_default_handles_all_forms_in_one_pass():
+    text = "{{a}} ${b} {c} $d $arg10 {missing} $"
+    params = {"a": 1, "b": "{c}", "c": "C", "d": "D", "arg1": "one", "arg10": "ten"}
+
+    out = replace_placeholders(text, params)
+
+    # Substituted values are not scanned again, so "{c}" from b stays literal.
+    assert out == "1 {c} C D ten {missing} $"
+
+
+def test_replace_placeholders_default_keeps_unknown_names_and_trailing_text():
+    text = "{{missing}} ${first.step} {other} $name. $named $$"
+    params = {"first.step": "S", "name": "N"}
+
+    assert replace_placeholders(text, params) == "{{missing}} S {other} N. Nd $$"
+
+
+def test_replace_placeholders_default_without_placeholders_returns_text():
+    assert replace_placeholders("keep {this} $as-is", {}) == "keep {this} $as-is"
+
+
+def test_replace_placeholders_skips_text_without_sigils(monkeypatch):
+    from guildbotics.utils import text_utils
+
+    class _FailingPattern:
+        def sub(self, *args):
+            raise AssertionError("pattern must not be scanned")
+
+    monkeypatch.setattr(text_utils, "_PLACEHOLDER_RE", _FailingPattern())
+
+    assert replace_placeholders("plain body", {"a": 1}) == "plain body"
+    # Jinja2 still renders: it drops the single trailing newline.
+    assert replace_placeholders("plain body\n", {}, "jinja2") == "plain body"
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "workflows/ticket_driven_workflow",
+        "  summarize  file=README.md\tlang=ja ",
+        'translate text="hello world" target=ja',
+        "echo it\\'s",
+        "greet name=太郎　様",
+        "",
+    ],
+)
+def test_split_command_line_matches_shlex(line):
+    assert split_command_line(line) == shlex.split(line)
+
+
+def test_get_placeholders_from_args_splits_on_first_equals_only():
+    assert get_placeholders_from_args(["key=a=b=c", "plain"]) == {
+        "key": "a=b=c",
+        "arg2": "plain",
+        "2": "plain",
+    }